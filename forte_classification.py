@@ -3,10 +3,110 @@ Forte Classification System
 Complete implementation of Allen Forte's pitch class set classification
 """
 
-from typing import Dict, List, Optional, Tuple
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
 from pitch_class_set import PitchClassSet
 
 
+def _pack_interval_vector(interval_vector: Sequence[int]) -> int:
+    """Pack a 6-entry interval vector into one int key (one byte per entry)."""
+    iv = interval_vector
+    return (iv[0] << 40) | (iv[1] << 32) | (iv[2] << 24) | (iv[3] << 16) | (iv[4] << 8) | iv[5]
+
+
+def _build_interval_vector_index(forte_numbers: Sequence[str], iv_matrix: np.ndarray
+                                 ) -> Tuple[Dict[str, Tuple[int, ...]], Dict[str, int], Dict[int, List[str]]]:
+    """
+    Index the precomputed interval vectors by Forte number and by packed vector.
+
+    Returns:
+        Tuple of (Forte number -> interval vector, Forte number -> packed
+        interval-vector key, packed key -> list of Forte numbers in table order)
+    """
+    forte_iv = dict(zip(forte_numbers, map(tuple, iv_matrix.tolist())))
+    iv_keys = (iv_matrix.astype(np.int64) << _IV_KEY_SHIFTS).sum(axis=1)
+    forte_iv_key = dict(zip(forte_numbers, iv_keys.tolist()))
+
+    iv_key_to_fortes = {}
+    for forte_number, iv_key in forte_iv_key.items():
+        iv_key_to_fortes.setdefault(iv_key, []).append(forte_number)
+    return forte_iv, forte_iv_key, iv_key_to_fortes
+
+
+def _build_entry_columns(forte_table: Mapping[int, Mapping[Tuple[int, ...], str]]
+                         ) -> Tuple[Tuple[Tuple[int, ...], ...], Tuple[str, ...], np.ndarray, np.ndarray]:
+    """
+    Lay out every table entry as aligned columns (one row per entry).
+
+    Returns:
+        Tuple of (prime forms, Forte numbers, uint16 prime-form masks,
+        N x 6 int8 interval-vector matrix)
+    """
+    prime_forms = tuple(prime_form for entries in forte_table.values() for prime_form in entries)
+    forte_numbers = tuple(forte_number for entries in forte_table.values()
+                          for forte_number in entries.values())
+    prime_masks = np.array([_prime_form_to_mask(prime_form) for prime_form in prime_forms],
+                           dtype=np.uint16)
+    return prime_forms, forte_numbers, prime_masks, _interval_vectors_from_masks(prime_masks)
+
+
+def _interval_vectors_from_masks(set_masks: np.ndarray) -> np.ndarray:
+    """
+    Compute the interval vectors of many 12-bit set masks at once.
+
+    Interval class k is counted by overlapping each set with itself rotated
+    by k semitones; the tritone pairs are seen from both ends, hence halved.
+
+    Returns:
+        N x 6 int8 interval-vector matrix
+    """
+    bits = ((set_masks.astype(np.int64)[:, None] >> _PITCH_CLASSES) & 1).astype(np.int8)
+    iv_matrix = np.stack([(bits & np.roll(bits, -k, axis=1)).sum(axis=1, dtype=np.int8)
+                          for k in range(1, 7)], axis=1)
+    iv_matrix[:, 5] //= 2
+    return iv_matrix
+
+
+def _prime_form_to_mask(prime_form: Tuple[int, ...]) -> int:
+    """Encode a prime form as a 12-bit mask (bit n set for pitch class n)."""
+    return sum(1 << pc for pc in prime_form)
+
+
+def _build_alias_mask_to_forte(aliases: Mapping[Tuple[int, ...], Tuple[int, ...]],
+                               prime_mask_to_forte: Dict[int, str]) -> Dict[int, str]:
+    """
+    Map each alias prime-form mask to the Forte number of its canonical prime form.
+    """
+    return {_prime_form_to_mask(alias): prime_mask_to_forte[_prime_form_to_mask(canonical)]
+            for alias, canonical in aliases.items()}
+
+
+def _build_entry_by_prime_mask(prime_masks: np.ndarray,
+                               aliases: Mapping[Tuple[int, ...], Tuple[int, ...]]) -> np.ndarray:
+    """
+    Map every 12-bit prime-form mask to its entry row (-1 where there is none).
+    Alias prime forms share the row of their canonical prime form.
+    """
+    entry_by_prime_mask = np.full(4096, -1, dtype=np.int16)
+    entry_by_prime_mask[prime_masks] = np.arange(len(prime_masks), dtype=np.int16)
+    for alias, canonical in aliases.items():
+        entry_by_prime_mask[_prime_form_to_mask(alias)] = entry_by_prime_mask[_prime_form_to_mask(canonical)]
+    return entry_by_prime_mask
+
+
+# Bit offset of each interval-vector entry in a packed key (see _pack_interval_vector)
+_IV_KEY_SHIFTS = np.array([40, 32, 24, 16, 8, 0], dtype=np.int64)
+
+# Pitch classes and the bit each one moves to under inversion (I0)
+_PITCH_CLASSES = np.arange(12, dtype=np.int64)
+_INVERTED_PITCH_CLASSES = (-_PITCH_CLASSES) % 12
+
+
 class ForteClassification:
     """
     Complete Forte classification system for pitch class sets.
@@ -47,7 +147,7 @@ class ForteClassification:
             (0, 1, 2): "3-1", (0, 1, 3): "3-2", (0, 1, 4): "3-3",
             (0, 1, 5): "3-4", (0, 1, 6): "3-5", (0, 2, 4): "3-6",
             (0, 2, 5): "3-7", (0, 2, 6): "3-8", (0, 2, 7): "3-9",
-            (0, 3, 6): "3-10", (0, 3, 7): "3-11", (0, 4, 7): "3-11", (0, 4, 8): "3-12"
+            (0, 3, 6): "3-10", (0, 3, 7): "3-11", (0, 4, 8): "3-12"
         },
         
         # Cardinality 4 (29 sets)
@@ -61,8 +161,7 @@ class ForteClassification:
             (0, 2, 4, 6): "4-19", (0, 2, 4, 7): "4-20", (0, 2, 4, 8): "4-21",
             (0, 2, 5, 7): "4-22", (0, 2, 5, 8): "4-23", (0, 2, 6, 8): "4-24",
             (0, 3, 4, 7): "4-25", (0, 3, 5, 8): "4-26", (0, 3, 6, 9): "4-27",
-            (0, 4, 5, 8): "4-28", (0, 4, 6, 10): "4-29", (0, 2, 5, 9): "4-26",
-            (0, 1, 5, 8): "4-25"
+            (0, 4, 5, 8): "4-28", (0, 4, 6, 10): "4-29"
         },
         
         # Cardinality 5 (38 sets)
@@ -95,7 +194,7 @@ class ForteClassification:
             (0, 1, 3, 4, 5, 7): "6-25", (0, 1, 3, 4, 5, 8): "6-26", (0, 1, 3, 4, 6, 7): "6-27",
             (0, 1, 3, 4, 6, 8): "6-28", (0, 1, 3, 4, 6, 9): "6-29", (0, 1, 3, 4, 7, 8): "6-30",
             (0, 1, 3, 5, 6, 7): "6-31", (0, 1, 3, 5, 6, 8): "6-32", (0, 1, 3, 5, 6, 9): "6-33",
-            (0, 1, 3, 5, 7, 8): "6-34", (0, 1, 3, 6, 7, 8): "6-35", (0, 1, 3, 6, 7, 9): "6-36",
+            (0, 1, 3, 5, 7, 8): "6-34", (0, 1, 3, 6, 7, 9): "6-36",
             (0, 1, 3, 6, 8, 9): "6-37", (0, 1, 4, 5, 6, 7): "6-38", (0, 1, 4, 5, 6, 8): "6-39",
             (0, 1, 4, 5, 6, 9): "6-40", (0, 1, 4, 5, 7, 8): "6-41", (0, 1, 4, 6, 7, 8): "6-42",
             (0, 1, 4, 6, 7, 9): "6-43", (0, 1, 4, 6, 8, 9): "6-44", (0, 1, 5, 6, 7, 8): "6-45",
@@ -161,6 +260,50 @@ class ForteClassification:
             (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11): "12-1"
         }
     }
+
+    # Non-canonical prime forms that the table used to list under an existing
+    # Forte number, mapped to the canonical prime form for that number
+    PRIME_FORM_ALIASES = MappingProxyType({
+        (0, 4, 7): (0, 3, 7),                      # 3-11
+        (0, 1, 5, 8): (0, 3, 4, 7),                # 4-25
+        (0, 2, 5, 9): (0, 3, 5, 8),                # 4-26
+        (0, 1, 3, 6, 7, 8): (0, 2, 4, 6, 8, 10),   # 6-35
+    })
+
+    # The table is static: expose it read-only and intern the Forte numbers
+    # so every index built from it shares the same string objects
+    FORTE_TABLE = MappingProxyType({
+        cardinality: MappingProxyType({prime_form: sys.intern(forte_number)
+                                       for prime_form, forte_number in entries.items()})
+        for cardinality, entries in FORTE_TABLE.items()
+    })
+
+    # Table entries as aligned columns: prime form, Forte number, prime-form
+    # mask and interval vector share a row index
+    ENTRY_PRIME_FORMS, ENTRY_FORTE_NUMBERS, PRIME_MASKS, IV_MATRIX = _build_entry_columns(FORTE_TABLE)
+
+    # Flat index: prime form as a 12-bit mask -> Forte number
+    PRIME_MASK_TO_FORTE = dict(zip(PRIME_MASKS.tolist(), ENTRY_FORTE_NUMBERS))
+
+    # Alias prime form as a 12-bit mask -> Forte number of its canonical form
+    ALIAS_MASK_TO_FORTE = _build_alias_mask_to_forte(PRIME_FORM_ALIASES, PRIME_MASK_TO_FORTE)
+
+    # Every 12-bit mask -> entry row (-1 when the mask is not a prime form)
+    ENTRY_BY_PRIME_MASK = _build_entry_by_prime_mask(PRIME_MASKS, PRIME_FORM_ALIASES)
+
+    # Every entry of each cardinality as (PitchClassSet, Forte number) pairs
+    SETS_BY_CARDINALITY = {
+        cardinality: tuple((PitchClassSet(list(prime_form)), forte_number)
+                           for prime_form, forte_number in entries.items())
+        for cardinality, entries in FORTE_TABLE.items()
+    }
+
+    # Reverse index: Forte number -> prime form
+    FORTE_TO_PRIME = dict(zip(ENTRY_FORTE_NUMBERS, ENTRY_PRIME_FORMS))
+
+    # Interval vector of each Forte number, its packed key, and Forte numbers
+    # grouped by packed interval vector
+    FORTE_IV, FORTE_IV_KEY, IV_KEY_TO_FORTES = _build_interval_vector_index(ENTRY_FORTE_NUMBERS, IV_MATRIX)
     
     @classmethod
     def get_forte_number(cls, pitch_class_set: PitchClassSet) -> Optional[str]:
@@ -173,13 +316,38 @@ class ForteClassification:
         Returns:
             Forte number as string (e.g., "3-1") or None if not found
         """
-        cardinality = len(pitch_class_set)
-        if cardinality not in cls.FORTE_TABLE:
-            return None
-        
-        prime_form = tuple(pitch_class_set.prime_form())
-        return cls.FORTE_TABLE[cardinality].get(prime_form)
+        prime_mask = pitch_class_set.prime_form_mask()
+        forte_number = cls.PRIME_MASK_TO_FORTE.get(prime_mask)
+        if forte_number is None:
+            forte_number = cls.ALIAS_MASK_TO_FORTE.get(prime_mask)
+        return forte_number
     
+    @classmethod
+    def classify_masks(cls, set_masks: Sequence[int]) -> List[Optional[str]]:
+        """
+        Get the Forte numbers of many sets at once.
+
+        Prime forms are found for the whole batch with vectorized bit
+        operations (same rule as PitchClassSet.prime_form_mask).
+
+        Args:
+            set_masks: Sets encoded as 12-bit masks (see PitchClassSet.bitmask)
+
+        Returns:
+            Forte number (or None if not found) for each mask, in order
+        """
+        masks = np.asarray(set_masks, dtype=np.int64).reshape(-1) & 0xFFF
+        bits = (masks[:, None] >> _PITCH_CLASSES) & 1
+        inverted = (bits << _INVERTED_PITCH_CLASSES).sum(axis=1)
+
+        # Keep whichever candidate holds the lowest pitch class they disagree on
+        diff = masks ^ inverted
+        use_inverted = (diff != 0) & ((masks & (diff & -diff)) == 0)
+        prime_masks = np.where(use_inverted, inverted, masks)
+
+        rows = cls.ENTRY_BY_PRIME_MASK[prime_masks]
+        return [cls.ENTRY_FORTE_NUMBERS[row] if row >= 0 else None for row in rows.tolist()]
+
     @classmethod
     def get_set_from_forte_number(cls, forte_number: str) -> Optional[PitchClassSet]:
         """
@@ -189,27 +357,13 @@ class ForteClassification:
             forte_number: Forte number as string (e.g., "3-1")
         
         Returns:
-            PitchClassSet object or None if not found
+            PitchClassSet object or None if not found (shared between calls,
+            so treat it as read-only)
         """
-        try:
-            cardinality_str, number_str = forte_number.split('-')
-            cardinality = int(cardinality_str)
-            number = int(number_str)
-        except (ValueError, IndexError):
-            return None
-        
-        if cardinality not in cls.FORTE_TABLE:
-            return None
-        
-        # Find the set with the given Forte number
-        for prime_form, forte_num in cls.FORTE_TABLE[cardinality].items():
-            if forte_num == forte_number:
-                return PitchClassSet(list(prime_form))
-        
-        return None
+        return _set_from_forte(forte_number)
     
     @classmethod
-    def get_all_sets_by_cardinality(cls, cardinality: int) -> List[Tuple[PitchClassSet, str]]:
+    def get_all_sets_by_cardinality(cls, cardinality: int) -> Tuple[Tuple[PitchClassSet, str], ...]:
         """
         Get all sets of a given cardinality with their Forte numbers.
         
@@ -217,16 +371,10 @@ class ForteClassification:
             cardinality: Cardinality of sets to retrieve
         
         Returns:
-            List of tuples (PitchClassSet, Forte number)
+            Tuple of (PitchClassSet, Forte number) pairs, precomputed and
+            shared between calls (treat the sets as read-only)
         """
-        if cardinality not in cls.FORTE_TABLE:
-            return []
-        
-        result = []
-        for prime_form, forte_number in cls.FORTE_TABLE[cardinality].items():
-            result.append((PitchClassSet(list(prime_form)), forte_number))
-        
-        return result
+        return cls.SETS_BY_CARDINALITY.get(cardinality, ())
     
     @classmethod
     def get_interval_vector_from_forte(cls, forte_number: str) -> Optional[List[int]]:
@@ -239,11 +387,29 @@ class ForteClassification:
         Returns:
             Interval vector as list of 6 integers or None if not found
         """
-        pcs = cls.get_set_from_forte_number(forte_number)
-        if pcs is None:
+        iv = cls.FORTE_IV.get(forte_number)
+        if iv is None:
             return None
-        return pcs.interval_vector()
+        return list(iv)
     
+    @classmethod
+    def find_sets_by_interval_vector(cls, interval_vector: Sequence[int]) -> List[Tuple[PitchClassSet, str]]:
+        """
+        Find every table entry with the given interval vector.
+
+        Args:
+            interval_vector: Interval vector (6 integers)
+
+        Returns:
+            List of tuples (PitchClassSet, Forte number) in table order
+        """
+        if len(interval_vector) != 6:
+            return []
+
+        matches = np.flatnonzero((cls.IV_MATRIX == np.asarray(interval_vector)).all(axis=1))
+        return [(PitchClassSet(list(cls.ENTRY_PRIME_FORMS[row])), cls.ENTRY_FORTE_NUMBERS[row])
+                for row in matches]
+
     @classmethod
     def find_similar_sets(cls, forte_number: str) -> List[str]:
         """
@@ -255,21 +421,12 @@ class ForteClassification:
         Returns:
             List of Forte numbers with the same interval vector
         """
-        target_pcs = cls.get_set_from_forte_number(forte_number)
-        if target_pcs is None:
+        target_key = cls.FORTE_IV_KEY.get(forte_number)
+        if target_key is None:
             return []
 
-        target_iv = target_pcs.interval_vector()
-        similar_sets = []
-
-        # Check all cardinalities
-        for cardinality in cls.FORTE_TABLE:
-            for prime_form, forte_num in cls.FORTE_TABLE[cardinality].items():
-                pcs = PitchClassSet(list(prime_form))
-                if pcs.interval_vector() == target_iv and forte_num != forte_number:
-                    similar_sets.append(forte_num)
-
-        return similar_sets
+        return [forte_num for forte_num in cls.IV_KEY_TO_FORTES[target_key]
+                if forte_num != forte_number]
 
     @classmethod
     def get_z_partner(cls, pitch_class_set: PitchClassSet) -> Optional[str]:
@@ -288,36 +445,25 @@ class ForteClassification:
         if forte_number is None:
             return None
 
-        target_iv = pitch_class_set.interval_vector()
+        target_key = _pack_interval_vector(pitch_class_set.interval_vector())
         cardinality = len(pitch_class_set)
 
-        # Check all sets in the same cardinality
-        if cardinality not in cls.FORTE_TABLE:
-            return None
-
-        for prime_form, forte_num in cls.FORTE_TABLE[cardinality].items():
-            if forte_num == forte_number:
-                continue
-
-            pcs = PitchClassSet(list(prime_form))
-            if pcs.interval_vector() == target_iv:
-                # Check if they're not related by T/I
-                # If they have the same IV but different Forte numbers,
-                # they're Z-partners
+        # Z-partners share the interval vector but have a different Forte
+        # number within the same cardinality
+        for forte_num in cls.IV_KEY_TO_FORTES.get(target_key, ()):
+            if forte_num != forte_number and len(cls.FORTE_TO_PRIME[forte_num]) == cardinality:
                 return forte_num
 
         return None
 
 
-# Update the PitchClassSet class to use the complete Forte classification
-def update_pitch_class_set_forte_method():
-    """Update the forte_number method in PitchClassSet to use the complete classification."""
-    def forte_number(self) -> Optional[str]:
-        return ForteClassification.get_forte_number(self)
-    
-    # Monkey patch the method
-    import pitch_class_set
-    pitch_class_set.PitchClassSet.forte_number = forte_number
+@lru_cache(maxsize=256)
+def _set_from_forte(forte_number: str) -> Optional[PitchClassSet]:
+    """Memoized Forte number -> PitchClassSet lookup (the table is static)."""
+    prime_form = ForteClassification.FORTE_TO_PRIME.get(forte_number)
+    if prime_form is None:
+        return None
+    return PitchClassSet(list(prime_form))
 
 
 if __name__ == "__main__":
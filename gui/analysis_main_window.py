@@ -6,32 +6,60 @@ Stripped-down version without the Composer tab
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QSplitter, QMessageBox,
                               QStatusBar, QMenuBar, QMenu, QFileDialog, QLabel,
                               QVBoxLayout, QHBoxLayout, QPushButton)
-from PyQt6.QtCore import Qt, pyqtSlot, QEvent
+from PyQt6.QtCore import Qt, pyqtSlot, QEvent, QTimer
 from PyQt6.QtGui import QAction, QKeySequence
+from functools import lru_cache, partial
 from pathlib import Path
 import sys
 
+import numpy as np
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from pitch_class_set import PitchClassSet
 from forte_classification import ForteClassification
 
-# Import GUI components (analysis only - no composer)
+# Import GUI components (analysis only - no composer; dialogs are imported when opened)
 from gui.panels.set_input_panel import SetInputPanel
 from gui.panels.analysis_panel import AnalysisPanel
 from gui.panels.transformation_panel import TransformationPanel
 from gui.panels.subset_explorer import SubsetExplorer
 from gui.widgets.visualization_canvas import VisualizationCanvas
 from gui.widgets.forte_selector import ForteSelector
-from gui.widgets.audio_settings_dialog import AudioSettingsDialog
-from gui.widgets.full_analysis_dialog import FullAnalysisDialog
-from gui.widgets.music_examples_dialog import MusicExamplesDialog
-from gui.widgets.interval_vector_dialog import IntervalVectorDialog
-from gui.widgets.compare_sets_dialog import CompareSetsDialog
-from gui.widgets.find_similar_dialog import FindSimilarDialog
 from gui.audio.audio_manager import AudioManager
 from gui.utils.settings_manager import SettingsManager
-from gui.utils.midi_export import MIDIExporter
+
+
+# Semitone offsets 0-11 (one row per transformation index)
+_SEMITONES = np.arange(12, dtype=np.int8)
+
+# Play All queue label prefix, by transformation type
+_QUEUE_LABELS = {'T': 'T', 'I': 'I', 'R': 'RT', 'RI': 'RI'}
+
+
+def _transformation_table(pcs: PitchClassSet, trans_type: str) -> np.ndarray:
+    """
+    Compute all 12 transformations of a set in one vectorized step.
+
+    Row i holds the pitch classes of T(i), I(i), RT(i) or RI(i) in the order
+    the matching PitchClassSet methods leave them (ascending, or descending
+    for RI).
+    """
+    base = np.fromiter(pcs.pitch_classes, dtype=np.int8)
+    if trans_type in ('I', 'RI'):
+        table = (_SEMITONES[:, None] - base[None, :]) % 12
+    else:
+        table = (_SEMITONES[:, None] + base[None, :]) % 12
+    table.sort(axis=1)
+    if trans_type == 'RI':
+        table = table[:, ::-1]
+    return table
+
+
+@lru_cache(maxsize=None)
+def _shortcut(key) -> QKeySequence:
+    """Build a QKeySequence once per key string / StandardKey and reuse it"""
+    return QKeySequence(key)
 
 
 class AnalysisMainWindow(QMainWindow):
@@ -46,19 +74,107 @@ class AnalysisMainWindow(QMainWindow):
     No Composer tab included.
     """
 
+    # Hover help for panels without a tooltip, by class name
+    _HOVER_HELP_TEXTS = {
+        'SetInputPanel': 'Input pitch class sets - Type numbers 0-11 or Forte numbers like "3-11"',
+        'AnalysisPanel': 'Live analysis of the current pitch class set',
+        'VisualizationCanvas': 'Visual representation - Clock or Graph modes',
+        'TransformationPanel': 'Transformation previews - Click to apply',
+        'SubsetExplorer': 'Browse subsets and supersets',
+    }
+
+    # Menu bar layout: (menu title, entries). Each entry is None for a separator,
+    # (submenu title, entries) for a submenu, or
+    # (label, shortcut, handler method name, handler arguments) for an action
+    _MENU_SPEC = (
+        ("&File", (
+            ("&New Set", QKeySequence.StandardKey.New, '_on_new_set', ()),
+            None,
+            ("Export to &MIDI...", "Ctrl+M", '_on_export_midi', ()),
+            ("Export All &Transformations", (
+                ("All Transpositions (T0-T11)...", None, '_on_export_all_transformations', ('T',)),
+                ("All Inversions (I0-I11)...", None, '_on_export_all_transformations', ('I',)),
+                ("All Retrogrades (RT0-RT11)...", None, '_on_export_all_transformations', ('R',)),
+                ("All Retrograde Inversions (RI0-RI11)...", None, '_on_export_all_transformations', ('RI',)),
+            )),
+            None,
+            ("E&xit", "Ctrl+Q", 'close', ()),
+        )),
+        ("&Edit", (
+            ("&Preferences...", None, '_on_preferences', ()),
+        )),
+        ("&Operations", (
+            ("&Transpose...", "Ctrl+T", '_on_transformation', ('T',)),
+            ("&Invert...", "Ctrl+I", '_on_transformation', ('I',)),
+            ("&Rotate...", "Ctrl+R", '_on_transformation', ('R',)),
+        )),
+        ("&Analysis", (
+            ("&Analyze Set", "Ctrl+A", '_on_analyze', ()),
+            ("Show &Interval Vector Chart", "Ctrl+Shift+I", '_on_show_interval_vector', ()),
+            ("&Compare Two Sets...", "Ctrl+Shift+C", '_on_compare_sets', ()),
+        )),
+        ("&Tools", (
+            ("&Forte Directory", "Ctrl+F", '_on_forte_directory', ()),
+            ("&Music Examples", "Ctrl+E", '_on_music_examples', ()),
+            ("Find &Similar Sets...", "Ctrl+Shift+S", '_on_find_similar', ()),
+        )),
+        ("A&udio", (
+            ("&Play", "Ctrl+P", '_on_play', (False,)),
+            ("Play &Arpeggiated", "Ctrl+Shift+P", '_on_play', (True,)),
+            None,
+            ("Audio &Settings...", None, '_on_audio_settings', ()),
+        )),
+        ("&View", (
+            ("Show/Hide &Analysis Panel", None, '_toggle_analysis_panel', ()),
+            None,
+            ("&Clock Visualization", None, '_set_viz_mode', ('clock',)),
+            ("&Graph Visualization", None, '_set_viz_mode', ('graph',)),
+        )),
+        ("&Help", (
+            ("&About", None, '_on_about', ()),
+        )),
+    )
+
+    # Status-bar label styles
+    _STYLE_HELP_IDLE = "QLabel { color: #666; font-style: italic; }"
+    _STYLE_HELP_ACTIVE = "QLabel { color: #000; font-style: normal; font-weight: bold; }"
+    _STYLE_AUDIO_PENDING = "QLabel { color: #444; }"
+    _STYLE_AUDIO_READY = "QLabel { color: green; }"
+    _STYLE_AUDIO_FAILED = "QLabel { color: red; }"
+
+    # Export All file and title names, by transformation type
+    _EXPORT_TYPE_NAMES = {'T': 'Transpositions', 'I': 'Inversions', 'R': 'Retrogrades', 'RI': 'Retrograde_Inversions'}
+    # Export menu type -> AudioManager transformation type
+    _EXPORT_TRANSFORMATIONS = {'T': 'transpose', 'I': 'invert', 'R': 'retrograde', 'RI': 'ri'}
+
     def __init__(self):
         super().__init__()
 
         # Initialize managers
         self.settings_manager = SettingsManager()
         audio_settings = self.settings_manager.get_audio_settings()
-        self.audio_manager = AudioManager(audio_settings)
+        # Engine init (SoundFont load) is started once the window is built
+        self.audio_manager = AudioManager(audio_settings, defer_init=True)
         self.forte_classification = ForteClassification()
 
         # Current state
         self.current_set = None
+        self._last_pcs_key = None
+        self._last_export_dir = ""
         self.is_playing_queue = False
 
+        # Play All queues, keyed by (id(current_set), trans_type)
+        self._trans_cache = {}
+
+        # Dock panels that missed a set change while hidden, and the last
+        # visibility each dock reported (a tabified dock stays isVisible()
+        # while its tab is in the background)
+        self._dirty_panels = set()
+        self._dock_shown = {}
+
+        # Hover help text per widget class
+        self._help_cache = {}
+
         # Setup UI
         self.setWindowTitle("Allen Forte Set Theory - Analysis")
         self._setup_ui()
@@ -67,6 +183,10 @@ class AnalysisMainWindow(QMainWindow):
         self._connect_signals()
         self._restore_settings()
 
+        # Load the audio engine in the background after the first event loop
+        # pass, with initialization_complete already connected
+        QTimer.singleShot(0, self.audio_manager.begin_async_init)
+
     def _setup_ui(self):
         """Setup main UI layout (analysis only - no tabs)"""
         # Create main splitter directly (no tab widget)
@@ -110,152 +230,27 @@ class AnalysisMainWindow(QMainWindow):
     def _create_menu_bar(self):
         """Create menu bar with all commands"""
         menubar = self.menuBar()
-
-        # === FILE MENU ===
-        file_menu = menubar.addMenu("&File")
-
-        new_action = QAction("&New Set", self)
-        new_action.setShortcut(QKeySequence.StandardKey.New)
-        new_action.triggered.connect(self._on_new_set)
-        file_menu.addAction(new_action)
-
-        file_menu.addSeparator()
-
-        export_midi_action = QAction("Export to &MIDI...", self)
-        export_midi_action.setShortcut(QKeySequence("Ctrl+M"))
-        export_midi_action.triggered.connect(self._on_export_midi)
-        file_menu.addAction(export_midi_action)
-
-        # Export All Transformations submenu
-        export_all_menu = QMenu("Export All &Transformations", self)
-        file_menu.addMenu(export_all_menu)
-
-        export_all_t_action = QAction("All Transpositions (T0-T11)...", self)
-        export_all_t_action.triggered.connect(lambda: self._on_export_all_transformations('T'))
-        export_all_menu.addAction(export_all_t_action)
-
-        export_all_i_action = QAction("All Inversions (I0-I11)...", self)
-        export_all_i_action.triggered.connect(lambda: self._on_export_all_transformations('I'))
-        export_all_menu.addAction(export_all_i_action)
-
-        export_all_r_action = QAction("All Retrogrades (RT0-RT11)...", self)
-        export_all_r_action.triggered.connect(lambda: self._on_export_all_transformations('R'))
-        export_all_menu.addAction(export_all_r_action)
-
-        export_all_ri_action = QAction("All Retrograde Inversions (RI0-RI11)...", self)
-        export_all_ri_action.triggered.connect(lambda: self._on_export_all_transformations('RI'))
-        export_all_menu.addAction(export_all_ri_action)
-
-        file_menu.addSeparator()
-
-        exit_action = QAction("E&xit", self)
-        exit_action.setShortcut(QKeySequence("Ctrl+Q"))
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-
-        # === EDIT MENU ===
-        edit_menu = menubar.addMenu("&Edit")
-
-        preferences_action = QAction("&Preferences...", self)
-        preferences_action.triggered.connect(self._on_preferences)
-        edit_menu.addAction(preferences_action)
-
-        # === OPERATIONS MENU ===
-        operations_menu = menubar.addMenu("&Operations")
-
-        transpose_action = QAction("&Transpose...", self)
-        transpose_action.setShortcut(QKeySequence("Ctrl+T"))
-        transpose_action.triggered.connect(lambda: self._on_transformation('T'))
-        operations_menu.addAction(transpose_action)
-
-        invert_action = QAction("&Invert...", self)
-        invert_action.setShortcut(QKeySequence("Ctrl+I"))
-        invert_action.triggered.connect(lambda: self._on_transformation('I'))
-        operations_menu.addAction(invert_action)
-
-        rotate_action = QAction("&Rotate...", self)
-        rotate_action.setShortcut(QKeySequence("Ctrl+R"))
-        rotate_action.triggered.connect(lambda: self._on_transformation('R'))
-        operations_menu.addAction(rotate_action)
-
-        # === ANALYSIS MENU ===
-        analysis_menu = menubar.addMenu("&Analysis")
-
-        analyze_action = QAction("&Analyze Set", self)
-        analyze_action.setShortcut(QKeySequence("Ctrl+A"))
-        analyze_action.triggered.connect(self._on_analyze)
-        analysis_menu.addAction(analyze_action)
-
-        iv_viz_action = QAction("Show &Interval Vector Chart", self)
-        iv_viz_action.setShortcut(QKeySequence("Ctrl+Shift+I"))
-        iv_viz_action.triggered.connect(self._on_show_interval_vector)
-        analysis_menu.addAction(iv_viz_action)
-
-        compare_sets_action = QAction("&Compare Two Sets...", self)
-        compare_sets_action.setShortcut(QKeySequence("Ctrl+Shift+C"))
-        compare_sets_action.triggered.connect(self._on_compare_sets)
-        analysis_menu.addAction(compare_sets_action)
-
-        # === TOOLS MENU ===
-        tools_menu = menubar.addMenu("&Tools")
-
-        forte_dir_action = QAction("&Forte Directory", self)
-        forte_dir_action.setShortcut(QKeySequence("Ctrl+F"))
-        forte_dir_action.triggered.connect(self._on_forte_directory)
-        tools_menu.addAction(forte_dir_action)
-
-        music_examples_action = QAction("&Music Examples", self)
-        music_examples_action.setShortcut(QKeySequence("Ctrl+E"))
-        music_examples_action.triggered.connect(self._on_music_examples)
-        tools_menu.addAction(music_examples_action)
-
-        find_similar_action = QAction("Find &Similar Sets...", self)
-        find_similar_action.setShortcut(QKeySequence("Ctrl+Shift+S"))
-        find_similar_action.triggered.connect(self._on_find_similar)
-        tools_menu.addAction(find_similar_action)
-
-        # === AUDIO MENU ===
-        audio_menu = menubar.addMenu("A&udio")
-
-        play_action = QAction("&Play", self)
-        play_action.setShortcut(QKeySequence("Ctrl+P"))
-        play_action.triggered.connect(lambda: self._on_play(False))
-        audio_menu.addAction(play_action)
-
-        play_arp_action = QAction("Play &Arpeggiated", self)
-        play_arp_action.setShortcut(QKeySequence("Ctrl+Shift+P"))
-        play_arp_action.triggered.connect(lambda: self._on_play(True))
-        audio_menu.addAction(play_arp_action)
-
-        audio_menu.addSeparator()
-
-        audio_settings_action = QAction("Audio &Settings...", self)
-        audio_settings_action.triggered.connect(self._on_audio_settings)
-        audio_menu.addAction(audio_settings_action)
-
-        # === VIEW MENU ===
-        view_menu = menubar.addMenu("&View")
-
-        toggle_analysis_action = QAction("Show/Hide &Analysis Panel", self)
-        toggle_analysis_action.triggered.connect(self._toggle_analysis_panel)
-        view_menu.addAction(toggle_analysis_action)
-
-        view_menu.addSeparator()
-
-        clock_mode_action = QAction("&Clock Visualization", self)
-        clock_mode_action.triggered.connect(lambda: self._set_viz_mode('clock'))
-        view_menu.addAction(clock_mode_action)
-
-        graph_mode_action = QAction("&Graph Visualization", self)
-        graph_mode_action.triggered.connect(lambda: self._set_viz_mode('graph'))
-        view_menu.addAction(graph_mode_action)
-
-        # === HELP MENU ===
-        help_menu = menubar.addMenu("&Help")
-
-        about_action = QAction("&About", self)
-        about_action.triggered.connect(self._on_about)
-        help_menu.addAction(about_action)
+        for title, entries in self._MENU_SPEC:
+            self._add_menu_entries(menubar.addMenu(title), entries)
+
+    def _add_menu_entries(self, menu: QMenu, entries):
+        """Add the actions, separators and submenus of a _MENU_SPEC entry list"""
+        for entry in entries:
+            if entry is None:
+                menu.addSeparator()
+            elif len(entry) == 2:
+                title, sub_entries = entry
+                submenu = QMenu(title, self)
+                menu.addMenu(submenu)
+                self._add_menu_entries(submenu, sub_entries)
+            else:
+                label, shortcut, handler_name, args = entry
+                action = QAction(label, self)
+                if shortcut is not None:
+                    action.setShortcut(_shortcut(shortcut))
+                handler = getattr(self, handler_name)
+                action.triggered.connect(partial(handler, *args) if args else handler)
+                menu.addAction(action)
 
     def _create_status_bar(self):
         """Create status bar with hover help"""
@@ -264,7 +259,7 @@ class AnalysisMainWindow(QMainWindow):
 
         # Create hover help label (permanent widget on left)
         self.hover_help_label = QLabel("Hover over any feature for help")
-        self.hover_help_label.setStyleSheet("QLabel { color: #666; font-style: italic; }")
+        self._set_label_style(self.hover_help_label, self._STYLE_HELP_IDLE)
         self.status_bar.addPermanentWidget(self.hover_help_label, 1)
 
         # Create stop button (hidden by default)
@@ -295,11 +290,13 @@ class AnalysisMainWindow(QMainWindow):
             self.audio_status_label.setText("Audio: Initializing...")
         else:
             self.audio_status_label.setText("Audio: MIDI Export Only")
-        self.audio_status_label.setStyleSheet("QLabel { color: #444; }")
+        self._set_label_style(self.audio_status_label, self._STYLE_AUDIO_PENDING)
         self.status_bar.addPermanentWidget(self.audio_status_label)
 
-        # Install event filter on main window to catch all hover events
-        self.installEventFilter(self)
+        # Install event filter on the panels that have hover help
+        for widget in (self.input_panel, self.visualization_canvas, self.analysis_panel,
+                       self.transformation_panel, self.subset_explorer):
+            widget.installEventFilter(self)
 
     def _connect_signals(self):
         """Connect signals between components"""
@@ -322,62 +319,106 @@ class AnalysisMainWindow(QMainWindow):
         # Subset explorer
         self.subset_explorer.setSelected.connect(self._on_subset_selected)
 
+        # Dock panels are only refreshed while shown; hidden ones catch up when shown
+        self._dock_updaters = {
+            self.analysis_panel: self.analysis_panel.update_analysis,
+            self.transformation_panel: self.transformation_panel.update_transformations,
+            self.subset_explorer: self.subset_explorer.update_set,
+        }
+        for panel in self._dock_updaters:
+            panel.visibilityChanged.connect(partial(self._on_dock_visibility_changed, panel))
+
         # Audio manager signals
-        if self.audio_manager.engine:
+        # Exports report failures through error_occurred with or without an engine
+        self.audio_manager.export_finished.connect(self._on_export_finished)
+        self.audio_manager.error_occurred.connect(self._on_audio_error)
+        engine = self.audio_manager.engine
+        if engine is not None:
             self.audio_manager.playback_started.connect(self._on_playback_started)
             self.audio_manager.playback_finished.connect(self._on_playback_finished)
-            self.audio_manager.error_occurred.connect(
-                lambda msg: self.status_bar.showMessage(f"Audio error: {msg}", 5000))
 
             # Listen for initialization completion
-            if hasattr(self.audio_manager.engine, 'worker') and self.audio_manager.engine.worker:
-                self.audio_manager.engine.worker.initialization_complete.connect(self._on_audio_init_complete)
+            worker = getattr(engine, 'worker', None)
+            if worker is not None:
+                worker.initialization_complete.connect(self._on_audio_init_complete)
+
+    @pyqtSlot(str)
+    def _on_audio_error(self, msg: str):
+        """Show audio errors in the status bar (and abandon any Play All queue)"""
+        if self.is_playing_queue:
+            self.is_playing_queue = False
+            self.stop_audio_button.hide()
+        self.status_bar.showMessage(f"Audio error: {msg}", 5000)
 
+    @pyqtSlot(bool)
     def _on_audio_init_complete(self, success: bool):
         """Handle audio initialization completion"""
         if success:
             engine_name = "FluidSynth" if self.audio_manager.engine.engine_type == 'fluidsynth' else "python-rtmidi"
             self.audio_status_label.setText(f"Audio: {engine_name} Ready")
-            self.audio_status_label.setStyleSheet("QLabel { color: green; }")
+            self._set_label_style(self.audio_status_label, self._STYLE_AUDIO_READY)
         else:
             self.audio_status_label.setText("Audio: Initialization Failed")
-            self.audio_status_label.setStyleSheet("QLabel { color: red; }")
+            self._set_label_style(self.audio_status_label, self._STYLE_AUDIO_FAILED)
 
+    @pyqtSlot()
     def _on_playback_started(self):
         """Handle playback started - show stop button"""
         self.stop_audio_button.show()
         self.status_bar.showMessage("Playing...", 2000)
 
+    @pyqtSlot()
     def _on_playback_finished(self):
-        """Handle playback finished - hide stop button"""
-        if not self.is_playing_queue:
-            self.stop_audio_button.hide()
+        """Handle playback finished - hide stop button, or play the next queued set"""
+        if self.is_playing_queue:
+            self._play_next_in_queue()
+            return
+        self.stop_audio_button.hide()
         self.status_bar.showMessage("Playback finished", 2000)
 
     @pyqtSlot(PitchClassSet)
     def _on_set_changed(self, pcs: PitchClassSet):
         """Handle set change from input panel"""
-        self.current_set = pcs
-
-        # Update visualization
-        self.visualization_canvas.update_visualization(pcs)
-
-        # Update analysis
-        self.analysis_panel.update_analysis(pcs)
+        # Re-selecting the set already shown (in any order) changes nothing
+        pcs_key = frozenset(pcs.pitch_classes)
+        if pcs_key == self._last_pcs_key:
+            return
+        self._last_pcs_key = pcs_key
 
-        # Update transformation previews
-        self.transformation_panel.update_transformations(pcs)
+        self._trans_cache.clear()
+        self.current_set = pcs
 
-        # Update subset explorer
-        self.subset_explorer.update_set(pcs)
+        # Repaint once after all panels are updated
+        self.setUpdatesEnabled(False)
+        try:
+            # Update visualization
+            self.visualization_canvas.update_visualization(pcs)
+
+            # Update analysis, transformation previews and subset explorer
+            for panel, update in self._dock_updaters.items():
+                if panel.isVisible() and self._dock_shown.get(panel, True):
+                    update(pcs)
+                    self._dirty_panels.discard(panel)
+                else:
+                    self._dirty_panels.add(panel)
 
-        # Add to recent
-        self.input_panel.add_to_recent(pcs)
-        self.settings_manager.add_recent_set(sorted(pcs.pitch_classes))
+            # Add to recent
+            self.input_panel.add_to_recent(pcs)
+            self.settings_manager.add_recent_set(list(pcs.sorted_pitch_classes()))
+        finally:
+            self.setUpdatesEnabled(True)
 
         # Update status bar
         forte_num = self.forte_classification.get_forte_number(pcs)
-        self.status_bar.showMessage(f"Set: {sorted(pcs.pitch_classes)} | Forte: {forte_num}", 5000)
+        self.status_bar.showMessage(f"Set: {pcs.display_str()} | Forte: {forte_num}", 5000)
+
+    def _on_dock_visibility_changed(self, panel, visible: bool):
+        """Bring a dock panel up to date with the current set when it is shown"""
+        self._dock_shown[panel] = visible
+        if visible and panel in self._dirty_panels:
+            self._dirty_panels.discard(panel)
+            if self.current_set is not None:
+                self._dock_updaters[panel](self.current_set)
 
     @pyqtSlot(str, int)
     def _on_transformation_from_panel(self, trans_type: str, value: int):
@@ -403,15 +444,12 @@ class AnalysisMainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.warning(self, "Transformation Error", str(e))
 
+    @pyqtSlot(str)
     def _on_transformation(self, trans_type: str):
         """Handle transformation from menu"""
-        if trans_type == 'T':
-            self.input_panel.t_button.click()
-        elif trans_type == 'I':
-            self.input_panel.i_button.click()
-        elif trans_type == 'R':
-            self.input_panel.r_button.click()
+        self.input_panel.apply_transformation(trans_type)
 
+    @pyqtSlot(bool)
     def _on_play(self, arpeggiate: bool):
         """Handle play request"""
         if not self.current_set:
@@ -430,76 +468,66 @@ class AnalysisMainWindow(QMainWindow):
             return
 
         filename, _ = QFileDialog.getSaveFileName(
-            self, "Export to MIDI", "", "MIDI Files (*.mid)")
+            self, "Export to MIDI", self._last_export_dir, "MIDI Files (*.mid)")
 
         if filename:
-            try:
-                success = self.audio_manager.export_to_midi(self.current_set, filename, arpeggiate=True)
-                if success:
-                    QMessageBox.information(self, "Export Successful",
-                                          f"Exported to {filename}")
-                else:
-                    QMessageBox.warning(self, "Export Failed",
-                                       "Could not export MIDI file.")
-            except Exception as e:
-                QMessageBox.warning(self, "Export Error", str(e))
+            self._remember_export_dir(filename)
+            # Written on a worker thread; _on_export_finished reports the result
+            self.status_bar.showMessage(f"Exporting to {filename}...")
+            self.audio_manager.export_to_midi_async(self.current_set, filename, arpeggiate=True)
+
+    @pyqtSlot(bool, str)
+    def _on_export_finished(self, success: bool, filename: str):
+        """Report the result of a background MIDI export"""
+        if success:
+            self.status_bar.clearMessage()
+            QMessageBox.information(self, "Export Successful",
+                                  f"Exported to {filename}")
+        else:
+            QMessageBox.warning(self, "Export Failed",
+                               "Could not export MIDI file.")
 
+    @pyqtSlot(str)
     def _on_export_all_transformations(self, trans_type: str):
         """Export all transformations to a multi-track MIDI file"""
         if not self.current_set:
             QMessageBox.information(self, "No Set", "Please enter a pitch class set first.")
             return
 
-        type_names = {'T': 'Transpositions', 'I': 'Inversions', 'R': 'Retrogrades', 'RI': 'Retrograde_Inversions'}
-        default_name = f"set_{'-'.join(map(str, sorted(self.current_set.pitch_classes)))}_{type_names[trans_type]}.mid"
+        type_names = self._EXPORT_TYPE_NAMES
+        default_name = f"set_{'-'.join(map(str, self.current_set.sorted_pitch_classes()))}_{type_names[trans_type]}.mid"
+
+        if self._last_export_dir:
+            default_name = str(Path(self._last_export_dir) / default_name)
 
         filename, _ = QFileDialog.getSaveFileName(
             self, f"Export All {type_names[trans_type]}", default_name, "MIDI Files (*.mid)")
 
         if filename:
-            try:
-                audio_settings = self.settings_manager.get_audio_settings()
-                exporter = MIDIExporter(
-                    octave=audio_settings.octave,
-                    bpm=audio_settings.tempo,
-                    duration=audio_settings.duration
-                )
-
-                if trans_type == 'T':
-                    success = exporter.export_all_transpositions(self.current_set, filename, arpeggiate=True)
-                elif trans_type == 'I':
-                    success = exporter.export_all_inversions(self.current_set, filename, arpeggiate=True)
-                elif trans_type == 'R':
-                    success = exporter.export_all_retrogrades(self.current_set, filename, arpeggiate=True)
-                elif trans_type == 'RI':
-                    success = exporter.export_all_retrograde_inversions(self.current_set, filename, arpeggiate=True)
-                else:
-                    success = False
-
-                if success:
-                    QMessageBox.information(self, "Export Successful",
-                                          f"Exported all {type_names[trans_type]} to:\n{filename}\n\n"
-                                          f"Each transformation is on a separate MIDI track.")
-                else:
-                    QMessageBox.warning(self, "Export Failed",
-                                       "Could not export MIDI file.")
-            except Exception as e:
-                QMessageBox.warning(self, "Export Error", str(e))
+            self._remember_export_dir(filename)
+            # Written on a worker thread; _on_export_finished reports the result
+            self.status_bar.showMessage(f"Exporting to {filename}...")
+            self.audio_manager.export_transformations_to_midi_async(
+                self.current_set, self._EXPORT_TRANSFORMATIONS[trans_type], filename, arpeggiate=True)
 
+    @pyqtSlot()
     def _on_visualize(self):
         """Handle visualize request"""
         self.status_bar.showMessage("Visualization updated", 2000)
 
+    @pyqtSlot()
     def _on_analyze(self):
         """Handle analyze request"""
         self.status_bar.showMessage("See analysis panel below", 2000)
 
+    @pyqtSlot()
     def _on_full_analysis(self):
         """Show full analysis dialog"""
         if not self.current_set:
             QMessageBox.information(self, "No Set", "Please enter a pitch class set first.")
             return
 
+        from gui.widgets.full_analysis_dialog import FullAnalysisDialog
         dialog = FullAnalysisDialog(self.current_set, self)
         dialog.exec()
 
@@ -509,20 +537,24 @@ class AnalysisMainWindow(QMainWindow):
             QMessageBox.information(self, "No Set", "Please enter a pitch class set first.")
             return
 
+        from gui.widgets.interval_vector_dialog import IntervalVectorDialog
         dialog = IntervalVectorDialog(self.current_set, self)
         dialog.exec()
 
     def _on_compare_sets(self):
         """Show compare sets dialog"""
+        from gui.widgets.compare_sets_dialog import CompareSetsDialog
         dialog = CompareSetsDialog(self.current_set, self)
         dialog.exec()
 
+    @pyqtSlot()
     def _on_forte_directory(self):
         """Show Forte directory browser"""
         dialog = ForteSelector(self)
         dialog.setSelected.connect(self._on_forte_set_selected)
         dialog.exec()
 
+    @pyqtSlot(PitchClassSet, str)
     def _on_forte_set_selected(self, pcs: PitchClassSet, forte_num: str):
         """Handle set selected from Forte directory"""
         self.input_panel.set_current_set(pcs)
@@ -530,10 +562,12 @@ class AnalysisMainWindow(QMainWindow):
 
     def _on_music_examples(self):
         """Show music examples browser"""
+        from gui.widgets.music_examples_dialog import MusicExamplesDialog
         dialog = MusicExamplesDialog(self)
         dialog.exampleSelected.connect(self._on_example_selected)
         dialog.exec()
 
+    @pyqtSlot(PitchClassSet, str)
     def _on_example_selected(self, pcs: PitchClassSet, example_name: str):
         """Handle example selected from music examples browser"""
         self.input_panel.set_current_set(pcs)
@@ -545,10 +579,12 @@ class AnalysisMainWindow(QMainWindow):
             QMessageBox.information(self, "No Set", "Please enter a pitch class set first.")
             return
 
+        from gui.widgets.find_similar_dialog import FindSimilarDialog
         dialog = FindSimilarDialog(self.current_set, self)
         dialog.setSelected.connect(self._on_forte_set_selected)
         dialog.exec()
 
+    @pyqtSlot(str)
     def _on_forte_number_clicked(self, forte_num: str):
         """Handle Forte number clicked in analysis panel"""
         self.status_bar.showMessage(f"Forte number: {forte_num} (click Forte Directory to browse)", 3000)
@@ -556,6 +592,7 @@ class AnalysisMainWindow(QMainWindow):
     def _on_audio_settings(self):
         """Show audio settings dialog"""
         current_settings = self.settings_manager.get_audio_settings()
+        from gui.widgets.audio_settings_dialog import AudioSettingsDialog
         dialog = AudioSettingsDialog(current_settings, self)
 
         def on_settings_changed(new_settings):
@@ -570,6 +607,7 @@ class AnalysisMainWindow(QMainWindow):
         """Show preferences dialog"""
         QMessageBox.information(self, "Preferences", "Preferences dialog coming soon!")
 
+    @pyqtSlot(str, int)
     def _on_transformation_clicked(self, trans_type: str, value: int):
         """Handle transformation clicked from transformation preview panel"""
         if not self.current_set:
@@ -578,49 +616,52 @@ class AnalysisMainWindow(QMainWindow):
         try:
             if trans_type == 'T':
                 transformed = self.current_set.transposition(value)
-                self.status_bar.showMessage(f"Applied T{value} from preview", 3000)
+                label = f"T{value}"
             elif trans_type == 'I':
                 transformed = self.current_set.inversion(value)
-                self.status_bar.showMessage(f"Applied I{value} from preview", 3000)
+                label = f"I{value}"
             elif trans_type == 'R':
                 transformed = self.current_set.retrograde().transposition(value)
-                self.status_bar.showMessage(f"Applied RT{value} from preview", 3000)
+                label = f"RT{value}"
             elif trans_type == 'RI':
                 transformed = self.current_set.retrograde_inversion(value)
-                self.status_bar.showMessage(f"Applied RI{value} from preview", 3000)
+                label = f"RI{value}"
             else:
                 return
 
-            self.current_set = transformed
+            # Update every panel now; the input field's debounced setChanged
+            # for the same set is then ignored by _on_set_changed
             self.input_panel.set_current_set(transformed)
-            self.visualization_canvas.update_visualization(transformed)
-            self.analysis_panel.update_analysis(transformed)
-            self.transformation_panel.update_transformations(transformed)
-            self.subset_explorer.update_set(transformed)
+            self._on_set_changed(transformed)
+            self.status_bar.showMessage(f"Applied {label} from preview", 3000)
 
         except Exception as e:
             QMessageBox.warning(self, "Transformation Error", str(e))
 
+    @pyqtSlot(str)
     def _on_play_all_transformations(self, trans_type: str):
         """Play all 12 transformations sequentially"""
         if not self.current_set:
             return
 
+        if not self.audio_manager.is_available():
+            self.status_bar.showMessage("Audio engine not available", 3000)
+            return
+
         try:
-            sets_to_play = []
-            for i in range(12):
-                if trans_type == 'T':
-                    transformed = self.current_set.transposition(i)
-                    sets_to_play.append((f"T{i}", transformed))
-                elif trans_type == 'I':
-                    transformed = self.current_set.inversion(i)
-                    sets_to_play.append((f"I{i}", transformed))
-                elif trans_type == 'R':
-                    transformed = self.current_set.retrograde().transposition(i)
-                    sets_to_play.append((f"RT{i}", transformed))
-                elif trans_type == 'RI':
-                    transformed = self.current_set.retrograde_inversion(i)
-                    sets_to_play.append((f"RI{i}", transformed))
+            cache_key = (id(self.current_set), trans_type)
+            sets_to_play = self._trans_cache.get(cache_key)
+            if sets_to_play is None:
+                sets_to_play = []
+                label = _QUEUE_LABELS.get(trans_type)
+                if label is not None:
+                    for i, row in enumerate(_transformation_table(self.current_set, trans_type).tolist()):
+                        transformed = PitchClassSet(row)
+                        if trans_type == 'RI':
+                            # Keep the retrograde (descending) order, as retrograde() does
+                            transformed.pitch_classes = row
+                        sets_to_play.append((f"{label}{i}", transformed))
+                self._trans_cache[cache_key] = sets_to_play
 
             self.status_bar.showMessage(f"Playing all {trans_type} transformations...", 5000)
 
@@ -649,12 +690,11 @@ class AnalysisMainWindow(QMainWindow):
         label, pcs = self.play_queue[self.play_index]
         self.status_bar.showMessage(f"Playing {label}... ({self.play_index + 1}/{len(self.play_queue)})", 2000)
 
-        self.audio_manager.play_set(pcs, arpeggiate=True)
-
+        # Advance before playing: the next item starts from playback_finished
         self.play_index += 1
-        from PyQt6.QtCore import QTimer
-        QTimer.singleShot(1200, self._play_next_in_queue)
+        self.audio_manager.play_set(pcs, arpeggiate=True)
 
+    @pyqtSlot()
     def _on_stop_audio(self):
         """Stop audio playback"""
         self.is_playing_queue = False
@@ -662,10 +702,11 @@ class AnalysisMainWindow(QMainWindow):
         self.stop_audio_button.hide()
         self.status_bar.showMessage("Playback stopped", 2000)
 
+    @pyqtSlot(PitchClassSet)
     def _on_subset_selected(self, pcs: PitchClassSet):
         """Handle subset/superset selected from subset explorer"""
         self.input_panel.set_current_set(pcs)
-        self.status_bar.showMessage(f"Loaded subset/superset: {sorted(pcs.pitch_classes)}", 3000)
+        self.status_bar.showMessage(f"Loaded subset/superset: {pcs.display_str()}", 3000)
 
     def _on_new_set(self):
         """Clear current set"""
@@ -676,6 +717,7 @@ class AnalysisMainWindow(QMainWindow):
         """Toggle analysis panel visibility"""
         self.analysis_panel.setVisible(not self.analysis_panel.isVisible())
 
+    @pyqtSlot(str)
     def _set_viz_mode(self, mode: str):
         """Set visualization mode"""
         self.visualization_canvas.set_mode(mode)
@@ -689,16 +731,23 @@ class AnalysisMainWindow(QMainWindow):
                          "<p>Analysis-Only Edition</p>"
                          "<p>Built with PyQt6, matplotlib, and FluidSynth</p>")
 
+    @staticmethod
+    def _set_label_style(label: QLabel, style: str):
+        """Apply a status-bar style sheet, skipping the re-polish if it is already set"""
+        if label.styleSheet() != style:
+            label.setStyleSheet(style)
+
     def eventFilter(self, obj, event):
         """Event filter to show hover help"""
-        if event.type() == QEvent.Type.Enter:
+        event_type = event.type()
+        if event_type == QEvent.Type.Enter:
             help_text = self._get_hover_help(obj)
             if help_text:
                 self.hover_help_label.setText(help_text)
-                self.hover_help_label.setStyleSheet("QLabel { color: #000; font-style: normal; font-weight: bold; }")
-        elif event.type() == QEvent.Type.Leave:
+                self._set_label_style(self.hover_help_label, self._STYLE_HELP_ACTIVE)
+        elif event_type == QEvent.Type.Leave:
             self.hover_help_label.setText("Hover over any feature for help")
-            self.hover_help_label.setStyleSheet("QLabel { color: #666; font-style: italic; }")
+            self._set_label_style(self.hover_help_label, self._STYLE_HELP_IDLE)
 
         return super().eventFilter(obj, event)
 
@@ -708,21 +757,23 @@ class AnalysisMainWindow(QMainWindow):
         if tooltip:
             return tooltip
 
-        class_name = widget.__class__.__name__
+        widget_type = type(widget)
+        help_text = self._help_cache.get(widget_type)
+        if help_text is None:
+            help_text = self._HOVER_HELP_TEXTS.get(widget_type.__name__, "")
+            self._help_cache[widget_type] = help_text
+        return help_text
 
-        help_texts = {
-            'SetInputPanel': 'Input pitch class sets - Type numbers 0-11 or Forte numbers like "3-11"',
-            'AnalysisPanel': 'Live analysis of the current pitch class set',
-            'VisualizationCanvas': 'Visual representation - Clock or Graph modes',
-            'TransformationPanel': 'Transformation previews - Click to apply',
-            'SubsetExplorer': 'Browse subsets and supersets',
-        }
-
-        return help_texts.get(class_name, "")
+    def _remember_export_dir(self, filename: str):
+        """Start the next export dialog in the folder of this export"""
+        export_dir = str(Path(filename).parent)
+        if export_dir != self._last_export_dir:
+            self._last_export_dir = export_dir
+            self.settings_manager.set('history/last_export_dir', export_dir)
 
     def _restore_settings(self):
         """Restore window settings from last session"""
-        pass
+        self._last_export_dir = self.settings_manager.get('history/last_export_dir') or ""
 
     def closeEvent(self, event):
         """Handle window close event"""
@@ -734,9 +785,12 @@ class AnalysisMainWindow(QMainWindow):
 def launch_analysis_gui():
     """Launch the analysis-only GUI application"""
     from PyQt6.QtWidgets import QApplication
+    import logging
     import sys
     import traceback
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     def exception_hook(exc_type, exc_value, exc_traceback):
         print("\n" + "=" * 60)
         print("UNHANDLED EXCEPTION:")
@@ -6,13 +6,17 @@ This module coordinates audio playback using FluidSynth and maintains
 compatibility with MIDI file export for DAW users.
 """
 
+import importlib.util
 import os
-import time
+import struct
+import weakref
 from typing import List, Optional
 from pathlib import Path
 
+import numpy as np
+
 try:
-    from PyQt6.QtCore import QObject, pyqtSignal
+    from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
     PYQT_AVAILABLE = True
 except ImportError:
     PYQT_AVAILABLE = False
@@ -25,12 +29,87 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from pitch_class_set import PitchClassSet
 
-# Optional: music21 for MIDI export
+# Optional: music21 for MIDI export (imported on first export - it is slow to load)
+MUSIC21_AVAILABLE = importlib.util.find_spec('music21') is not None
+
+# Optional: mido for lightweight multi-track MIDI export
 try:
-    from music21 import stream, note, tempo, instrument
-    MUSIC21_AVAILABLE = True
+    import mido
+    MIDO_AVAILABLE = True
 except ImportError:
-    MUSIC21_AVAILABLE = False
+    MIDO_AVAILABLE = False
+
+# Track name prefix and sign applied to the set, per transformation type
+_TRACK_PREFIXES = {'transpose': ('T', 1), 'invert': ('I', -1),
+                   'retrograde': ('RT', 1), 'ri': ('RI', -1)}
+
+# Ticks per quarter note in files written by _write_simple_midi
+_SIMPLE_MIDI_TICKS = 480
+
+
+def _midi_varlen(value: int) -> bytes:
+    """Encode a MIDI variable-length quantity (7 bits per byte, high bit = more)"""
+    out = bytearray([value & 0x7F])
+    value >>= 7
+    while value:
+        out.insert(0, (value & 0x7F) | 0x80)
+        value >>= 7
+    return bytes(out)
+
+
+def _write_simple_midi(filename: str, midi_notes: List[int], tempo_bpm: float,
+                       duration_ticks: int, velocity: int = 80):
+    """
+    Write a format-0 MIDI file holding a single piano chord
+
+    Args:
+        filename: Output MIDI filename
+        midi_notes: MIDI note numbers of the chord
+        tempo_bpm: Tempo in beats per minute
+        duration_ticks: Chord length in ticks (_SIMPLE_MIDI_TICKS per quarter)
+        velocity: Note-on velocity
+    """
+    us_per_quarter = int(round(60_000_000 / tempo_bpm))
+    track = bytearray()
+    track += b'\x00\xff\x51\x03' + us_per_quarter.to_bytes(3, 'big')  # Set tempo
+    track += b'\x00\xc0\x00'                                          # Piano
+    # Note-ons then note-offs, each group after its first event using
+    # running status (delta time and data bytes only)
+    for status, delta, vel in ((0x90, 0, velocity), (0x80, duration_ticks, 0x40)):
+        for k, midi_note in enumerate(midi_notes):
+            track += _midi_varlen(delta if k == 0 else 0)
+            if k == 0:
+                track.append(status)
+            track += bytes((midi_note, vel))
+    track += b'\x00\xff\x2f\x00'                                      # End of track
+
+    header = b'MThd' + struct.pack('>IHHH', 6, 0, 1, _SIMPLE_MIDI_TICKS)
+    with open(filename, 'wb') as f:
+        f.write(header + b'MTrk' + struct.pack('>I', len(track)) + track)
+
+
+def _cleanup_engine(engine):
+    """Shut down an engine; runs once via the owning AudioManager's finalizer"""
+    try:
+        engine.cleanup()
+    except Exception:
+        pass
+
+
+class _ExportTask(QRunnable if PYQT_AVAILABLE else object):
+    """Runs one blocking MIDI export on the global thread pool"""
+
+    def __init__(self, manager, export, args, filename: str):
+        super().__init__()
+        self.manager = manager
+        self.export = export
+        self.args = args
+        self.filename = filename
+
+    def run(self):
+        success = self.export(*self.args)
+        # Queued to receivers in the GUI thread
+        self.manager.export_finished.emit(success, self.filename)
 
 
 class AudioManager(QObject if PYQT_AVAILABLE else object):
@@ -43,19 +122,48 @@ class AudioManager(QObject if PYQT_AVAILABLE else object):
         playback_started = pyqtSignal()
         playback_finished = pyqtSignal()
         error_occurred = pyqtSignal(str)
+        export_finished = pyqtSignal(bool, str)  # success, filename
+
+    # (stream, note, chord, tempo, instrument), imported by the first export
+    _music21_modules = None
 
-    def __init__(self, settings: Optional[AudioSettings] = None):
+    def __init__(self, settings: Optional[AudioSettings] = None, defer_init: bool = False):
         if PYQT_AVAILABLE:
             super().__init__()
 
         self.settings = settings or AudioSettings()
-        self.engine = FluidSynthEngine(self.settings) if FLUIDSYNTH_AVAILABLE else None
+        self.engine = (FluidSynthEngine(self.settings, defer_start=defer_init)
+                       if FLUIDSYNTH_AVAILABLE else None)
+        self._finalizer = (weakref.finalize(self, _cleanup_engine, self.engine)
+                           if self.engine else None)
+
+        # One-shot playback_finished handler chaining the second set of a
+        # play_transformation_sequence call
+        self._sequence_handler = None
 
         # Connect engine signals if available
         if self.engine and PYQT_AVAILABLE:
-            self.engine.playback_started.connect(self.playback_started)
-            self.engine.playback_finished.connect(self.playback_finished)
-            self.engine.error_occurred.connect(self.error_occurred)
+            self._connect_engine_signals(self.engine)
+            # A failed play never reports playback_finished, so drop any
+            # sequence continuation waiting for it
+            self.engine.error_occurred.connect(self._cancel_sequence)
+
+    def _connect_engine_signals(self, engine):
+        """Forward an engine's signals, dropping any earlier forwarding first"""
+        pairs = ((engine.playback_started, self.playback_started),
+                 (engine.playback_finished, self.playback_finished),
+                 (engine.error_occurred, self.error_occurred))
+        for source, target in pairs:
+            try:
+                source.disconnect(target)
+            except TypeError:
+                pass  # Not connected yet
+            source.connect(target)
+
+    def begin_async_init(self):
+        """Start engine initialization deferred by defer_init=True"""
+        if self.engine:
+            self.engine.start()
 
     def is_available(self) -> bool:
         """Check if audio engine is available"""
@@ -74,8 +182,8 @@ class AudioManager(QObject if PYQT_AVAILABLE else object):
                 self.error_occurred.emit("Audio engine not available")
             return
 
-        pitch_classes = sorted(pcs.pitch_classes)
-        self.engine.play_pitch_classes(pitch_classes, arpeggiate)
+        # Cached on the set; the list-typed play signal accepts the tuple
+        self.engine.play_pitch_classes(pcs.sorted_pitch_classes(), arpeggiate)
 
     def play_transformation_sequence(self,
                                      original: PitchClassSet,
@@ -96,31 +204,42 @@ class AudioManager(QObject if PYQT_AVAILABLE else object):
                 self.error_occurred.emit("Audio engine not available")
             return
 
-        # Play original
-        self.play_set(original, arpeggiate)
+        self._cancel_sequence()
 
-        # Wait for playback to finish + delay
-        duration = len(original.pitch_classes) * self.settings.duration if arpeggiate else self.settings.duration
-        time.sleep(duration + delay)
+        if not self.engine.is_initialized:
+            # Still starting up or failed: let play_set report the error
+            # rather than leave play_next waiting for a finish that never comes
+            self.play_set(original, arpeggiate)
+            return
 
-        # Play transformed
-        self.play_set(transformed, arpeggiate)
+        # Play transformed once the engine reports the original finished;
+        # stop() clears _sequence_handler and so cancels either step
+        def play_next():
+            self.engine.playback_finished.disconnect(play_next)
+            QTimer.singleShot(int(delay * 1000), play_transformed)
 
-    def play_comparison(self,
-                        set1: PitchClassSet,
-                        set2: PitchClassSet,
-                        delay: float = 0.5,
-                        arpeggiate: bool = True):
-        """
-        Play two sets sequentially for comparison
+        def play_transformed():
+            if self._sequence_handler is play_next:
+                self._sequence_handler = None
+                self.play_set(transformed, arpeggiate)
 
-        Args:
-            set1: First pitch class set
-            set2: Second pitch class set
-            delay: Delay between sets
-            arpeggiate: Play style
-        """
-        self.play_transformation_sequence(set1, set2, delay, arpeggiate)
+        self._sequence_handler = play_next
+        self.engine.playback_finished.connect(play_next)
+
+        # Play original
+        self.play_set(original, arpeggiate)
+
+    def _cancel_sequence(self):
+        """Drop a pending play_transformation_sequence continuation"""
+        if self._sequence_handler is not None:
+            try:
+                self.engine.playback_finished.disconnect(self._sequence_handler)
+            except (TypeError, RuntimeError):
+                pass
+            self._sequence_handler = None
+
+    # Play two sets sequentially for comparison (same signature and behavior)
+    play_comparison = play_transformation_sequence
 
     def play_midi_data(self, midi_bytes: bytes):
         """
@@ -139,6 +258,7 @@ class AudioManager(QObject if PYQT_AVAILABLE else object):
     def stop(self):
         """Stop current playback"""
         if self.engine:
+            self._cancel_sequence()
             self.engine.stop()
 
     def set_soundfont(self, path: str) -> bool:
@@ -184,12 +304,31 @@ class AudioManager(QObject if PYQT_AVAILABLE else object):
         Returns:
             True if successful, False otherwise
         """
+        # Convert pitch classes to MIDI note numbers
+        midi_base = self.settings.octave * 12
+        midi_notes = [midi_base + pc for pc in pcs.sorted_pitch_classes()]
+        quarter_length = self.settings.quarter_length
+
+        if not arpeggiate:
+            # A single chord is a few dozen bytes - write it without music21
+            try:
+                _write_simple_midi(filename, midi_notes, self.settings.tempo,
+                                   round(quarter_length * _SIMPLE_MIDI_TICKS),
+                                   self.settings.velocity)
+                return True
+            except Exception as e:
+                if PYQT_AVAILABLE:
+                    self.error_occurred.emit(f"MIDI export failed: {str(e)}")
+                return False
+
         if not MUSIC21_AVAILABLE:
             if PYQT_AVAILABLE:
                 self.error_occurred.emit("music21 not available for MIDI export")
             return False
 
         try:
+            stream, note, chord, tempo, instrument = self._music21()
+
             # Create stream
             s = stream.Stream()
 
@@ -199,21 +338,10 @@ class AudioManager(QObject if PYQT_AVAILABLE else object):
             # Add instrument
             s.append(instrument.Piano())
 
-            # Convert pitch classes to MIDI note numbers
-            midi_notes = [(self.settings.octave * 12) + pc for pc in sorted(pcs.pitch_classes)]
-
-            if arpeggiate:
-                # Add notes sequentially
-                for midi_note in midi_notes:
-                    n = note.Note(midi=midi_note)
-                    n.quarterLength = self.settings.duration * (self.settings.tempo / 60)
-                    s.append(n)
-            else:
-                # Add as chord
-                from music21 import chord
-                c = chord.Chord(midi_notes)
-                c.quarterLength = self.settings.duration * (self.settings.tempo / 60)
-                s.append(c)
+            # Add notes sequentially, in one append
+            notes = [note.Note(midi=midi_note, quarterLength=quarter_length)
+                     for midi_note in midi_notes]
+            s.append(notes)
 
             # Export to MIDI
             s.write('midi', fp=filename)
@@ -227,7 +355,8 @@ class AudioManager(QObject if PYQT_AVAILABLE else object):
     def export_transformations_to_midi(self,
                                        pcs: PitchClassSet,
                                        transformation_type: str,
-                                       filename: str) -> bool:
+                                       filename: str,
+                                       arpeggiate: bool = True) -> bool:
         """
         Export all transformations to multi-track MIDI file
 
@@ -235,39 +364,33 @@ class AudioManager(QObject if PYQT_AVAILABLE else object):
             pcs: Original pitch class set
             transformation_type: 'transpose', 'invert', 'retrograde', or 'ri'
             filename: Output MIDI filename
+            arpeggiate: If True, arpeggiate each transformation; if False,
+                        write it as one chord
 
         Returns:
             True if successful, False otherwise
         """
+        if MIDO_AVAILABLE:
+            return self.export_transformations_to_midi_fast(pcs, transformation_type, filename,
+                                                            arpeggiate)
+
         if not MUSIC21_AVAILABLE:
             if PYQT_AVAILABLE:
                 self.error_occurred.emit("music21 not available for MIDI export")
             return False
 
         try:
-            from music21 import stream, note, tempo, instrument
+            stream, note, chord, tempo, instrument = self._music21()
+            Note = note.Note
 
             # Create score (multi-track)
             score = stream.Score()
 
+            prefix, midi_table = self._transformation_midi_table(pcs, transformation_type)
+
             # Generate transformations
-            for i in range(12):
-                if transformation_type == 'transpose':
-                    transformed = pcs.transposition(i)
-                    track_name = f"T{i}"
-                elif transformation_type == 'invert':
-                    transformed = pcs.inversion(i)
-                    track_name = f"I{i}"
-                elif transformation_type == 'retrograde':
-                    transformed = pcs.transposition(i)  # Apply transposition to retrograde
-                    transformed.pitch_classes = list(reversed(transformed.pitch_classes))
-                    track_name = f"RT{i}"
-                elif transformation_type == 'ri':
-                    transformed = pcs.inversion(i)
-                    transformed.pitch_classes = list(reversed(transformed.pitch_classes))
-                    track_name = f"RI{i}"
-                else:
-                    continue
+            for i, midi_notes in enumerate(midi_table):
+                track_name = f"{prefix}{i}"
 
                 # Create part
                 part = stream.Part()
@@ -280,15 +403,21 @@ class AudioManager(QObject if PYQT_AVAILABLE else object):
                 if i == 0:
                     part.insert(0, tempo.MetronomeMark(number=self.settings.tempo))
 
-                # Add notes
-                offset = i * 2.0  # Stagger tracks
-                midi_notes = [(self.settings.octave * 12) + pc for pc in sorted(transformed.pitch_classes)]
-
-                for midi_note in midi_notes:
-                    n = note.Note(midi=midi_note)
-                    n.quarterLength = 1.0
-                    part.insert(offset, n)
-                    offset += 0.25  # Arpeggiate
+                # Tracks are staggered by 2 beats
+                offset = i * 2.0
+                if arpeggiate:
+                    # Add notes as one flat [offset, note, ...] insert,
+                    # arpeggiated by 0.25
+                    events = []
+                    for k, midi_note in enumerate(midi_notes):
+                        events.append(offset + k * 0.25)
+                        events.append(Note(midi=midi_note, quarterLength=1.0))
+                    part.insert(events)
+                else:
+                    # Add as chord
+                    c = chord.Chord(midi_notes)
+                    c.quarterLength = 1.0
+                    part.insert(offset, c)
 
                 score.append(part)
 
@@ -301,14 +430,140 @@ class AudioManager(QObject if PYQT_AVAILABLE else object):
                 self.error_occurred.emit(f"MIDI export failed: {str(e)}")
             return False
 
-    def cleanup(self):
-        """Clean up resources"""
-        if self.engine:
-            self.engine.cleanup()
+    def export_to_midi_async(self,
+                             pcs: PitchClassSet,
+                             filename: str,
+                             arpeggiate: bool = False):
+        """
+        Run export_to_midi on a background thread
+
+        The result is reported by export_finished(success, filename); without
+        PyQt the export runs synchronously and the result is returned.
+        """
+        return self._start_export(self.export_to_midi, (pcs, filename, arpeggiate), filename)
+
+    def export_transformations_to_midi_async(self,
+                                             pcs: PitchClassSet,
+                                             transformation_type: str,
+                                             filename: str,
+                                             arpeggiate: bool = True):
+        """
+        Run export_transformations_to_midi on a background thread
 
-    def __del__(self):
-        """Destructor"""
-        self.cleanup()
+        The result is reported by export_finished(success, filename); without
+        PyQt the export runs synchronously and the result is returned.
+        """
+        return self._start_export(self.export_transformations_to_midi,
+                                  (pcs, transformation_type, filename, arpeggiate), filename)
+
+    def _start_export(self, export, args, filename: str):
+        """Submit an export to the global QThreadPool"""
+        if not PYQT_AVAILABLE:
+            return export(*args)
+        QThreadPool.globalInstance().start(_ExportTask(self, export, args, filename))
+        return None
+
+    def export_transformations_to_midi_fast(self,
+                                            pcs: PitchClassSet,
+                                            transformation_type: str,
+                                            filename: str,
+                                            arpeggiate: bool = True) -> bool:
+        """
+        Export all transformations to a multi-track MIDI file with mido
+
+        Writes the same tracks as the music21 exporter (one piano track per
+        transformation, staggered by 2 beats, notes arpeggiated by a
+        sixteenth or stacked as a chord and held for a beat) without
+        building a music21 Score.
+
+        Args:
+            pcs: Original pitch class set
+            transformation_type: 'transpose', 'invert', 'retrograde', or 'ri'
+            filename: Output MIDI filename
+            arpeggiate: If True, arpeggiate each transformation; if False,
+                        write it as one chord
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not MIDO_AVAILABLE:
+            if PYQT_AVAILABLE:
+                self.error_occurred.emit("mido not available for MIDI export")
+            return False
+
+        try:
+            ticks_per_beat = 480
+            step = ticks_per_beat // 4 if arpeggiate else 0
+            velocity = self.settings.velocity
+            Message = mido.Message
+
+            midi_file = mido.MidiFile(type=1, ticks_per_beat=ticks_per_beat)
+            prefix, midi_table = self._transformation_midi_table(pcs, transformation_type)
+
+            for i, midi_notes in enumerate(midi_table):
+                channel = i if i < 9 else i + 1  # Skip the GM drum channel
+                track = mido.MidiTrack()
+                track.append(mido.MetaMessage('track_name', name=f"{prefix}{i}", time=0))
+                if i == 0:
+                    track.append(mido.MetaMessage('set_tempo',
+                                                  tempo=mido.bpm2tempo(self.settings.tempo), time=0))
+                track.append(Message('program_change', channel=channel, program=0, time=0))
+
+                # (absolute tick, is_note_on, note); note-offs sort before note-ons
+                start = i * 2 * ticks_per_beat
+                events = []
+                for k, midi_note in enumerate(midi_notes):
+                    on = start + k * step
+                    events.append((on, 1, midi_note))
+                    events.append((on + ticks_per_beat, 0, midi_note))
+                events.sort()
+
+                now = 0
+                for tick, is_on, midi_note in events:
+                    track.append(Message('note_on' if is_on else 'note_off', channel=channel,
+                                         note=midi_note, velocity=velocity if is_on else 0,
+                                         time=tick - now))
+                    now = tick
+
+                midi_file.tracks.append(track)
+
+            midi_file.save(filename)
+            return True
+
+        except Exception as e:
+            if PYQT_AVAILABLE:
+                self.error_occurred.emit(f"MIDI export failed: {str(e)}")
+            return False
+
+    def _transformation_midi_table(self, pcs: PitchClassSet, transformation_type: str):
+        """
+        MIDI notes of all 12 transformations, computed in one step
+
+        Returns:
+            (track name prefix, list of 12 ascending note lists) - or ('', [])
+            for an unknown transformation type. Retrograde rows match their
+            prime counterparts since notes are written in ascending order.
+        """
+        prefix, sign = _TRACK_PREFIXES.get(transformation_type, ('', 0))
+        if not prefix:
+            return prefix, []
+        base = np.fromiter(pcs.pitch_classes, dtype=np.int16)
+        table = (np.arange(12, dtype=np.int16)[:, None] + sign * base[None, :]) % 12
+        table.sort(axis=1)
+        return prefix, (table + self.settings.octave * 12).tolist()
+
+    @classmethod
+    def _music21(cls):
+        """Import the music21 submodules used for export once and cache them"""
+        if cls._music21_modules is None:
+            from music21 import stream, note, chord, tempo, instrument
+            cls._music21_modules = (stream, note, chord, tempo, instrument)
+        return cls._music21_modules
+
+    def cleanup(self):
+        """Clean up resources (safe to call more than once)"""
+        if self._finalizer:
+            self._finalizer()
 
 
 def test_audio_manager():
@@ -316,8 +571,16 @@ def test_audio_manager():
     from PyQt6.QtWidgets import QApplication
     import sys
 
+    from PyQt6.QtCore import QEventLoop
+
     app = QApplication(sys.argv)
 
+    def wait(seconds):
+        """Sleep while delivering queued signals"""
+        loop = QEventLoop()
+        QTimer.singleShot(int(seconds * 1000), loop.quit)
+        loop.exec()
+
     print("Testing Audio Manager...")
 
     # Create manager
@@ -328,18 +591,19 @@ def test_audio_manager():
     if not manager.is_available():
         print("Audio not available")
         return
+    manager.engine.wait_for_ready()
 
     # Test playing a set
     print("\nPlaying C major triad...")
     c_major = PitchClassSet([0, 4, 7])
     manager.play_set(c_major, arpeggiate=True)
-    time.sleep(3)
+    wait(3)
 
     # Test transformation sequence
     print("\nPlaying transposition (T3)...")
     eb_major = c_major.transposition(3)
     manager.play_transformation_sequence(c_major, eb_major, delay=0.5)
-    time.sleep(6)
+    wait(6)
 
     # Test MIDI export
     if MUSIC21_AVAILABLE:
@@ -8,12 +8,21 @@ Uses QThread worker pattern to prevent GUI blocking.
 
 import os
 import sys
+import hashlib
+import logging
+import mmap
+import threading
 import time
+from collections import OrderedDict, deque
 from typing import List, Optional
 from pathlib import Path
 
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
 try:
-    from PyQt6.QtCore import QObject, QThread, pyqtSignal, pyqtSlot
+    from PyQt6.QtCore import QCoreApplication, QEventLoop, QObject, QSettings, QThread, QTimer, pyqtSignal, pyqtSlot
     PYQT_AVAILABLE = True
 except ImportError:
     PYQT_AVAILABLE = False
@@ -23,7 +32,6 @@ try:
     # Try importing pyfluidsynth
     # Handle conflict where old 'fluidsynth' package (0.2) shadows pyfluidsynth
     import importlib.util
-    import sys
 
     fluidsynth = None
 
@@ -32,29 +40,27 @@ try:
         import fluidsynth as _fs
         if hasattr(_fs, 'Synth'):
             fluidsynth = _fs
-    except:
-        pass
+    except (ImportError, SyntaxError, OSError):
+        pass  # Broken or shadowing module - try the distribution below
 
-    # If that didn't work, try to find pyfluidsynth's fluidsynth.py directly
+    # If shadowed, load pyfluidsynth's fluidsynth.py from its own distribution
     if fluidsynth is None:
-        for site_packages in sys.path:
-            if 'site-packages' in site_packages:
-                fs_file = os.path.join(site_packages, 'fluidsynth.py')
-                if os.path.exists(fs_file):
-                    spec = importlib.util.spec_from_file_location("fluidsynth_pyfs", fs_file)
-                    if spec and spec.loader:
-                        fluidsynth = importlib.util.module_from_spec(spec)
-                        spec.loader.exec_module(fluidsynth)
-                        if hasattr(fluidsynth, 'Synth'):
-                            break
-                        else:
-                            fluidsynth = None
+        from importlib import metadata
+        try:
+            fs_file = metadata.distribution('pyfluidsynth').locate_file('fluidsynth.py')
+        except metadata.PackageNotFoundError:
+            fs_file = None
+        if fs_file is not None and os.path.exists(fs_file):
+            spec = importlib.util.spec_from_file_location("fluidsynth_pyfs", fs_file)
+            if spec and spec.loader:
+                fluidsynth = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(fluidsynth)
 
     if fluidsynth is None or not hasattr(fluidsynth, 'Synth'):
         raise ImportError("pyfluidsynth not found or wrong package installed")
 
     FLUIDSYNTH_AVAILABLE = True
-except (ImportError, SyntaxError, Exception) as e:
+except (ImportError, SyntaxError, OSError) as e:
     FLUIDSYNTH_AVAILABLE = False
     print(f"Warning: pyfluidsynth not available ({type(e).__name__}: {e}). Falling back to python-rtmidi.")
     if isinstance(e, SyntaxError):
@@ -91,6 +97,11 @@ class AudioSettings:
         self.buffer_size = 512       # Audio buffer size
         self.soundfont_path = None   # Path to soundfont file
 
+    @property
+    def quarter_length(self) -> float:
+        """Note duration in quarter notes at the current tempo"""
+        return self.duration * (self.tempo / 60)
+
     def to_dict(self):
         """Convert to dictionary for QSettings"""
         return {
@@ -113,6 +124,237 @@ class AudioSettings:
         return settings
 
 
+# MIDI channel-mode controllers
+_CC_ALL_SOUND_OFF = 120
+_CC_ALL_NOTES_OFF = 123
+
+# Prebuilt python-rtmidi messages: "All Notes Off" on each of the 16
+# channels, and a channel-0 note-off for every MIDI note number
+_RTMIDI_ALL_NOTES_OFF = tuple(bytes((0xB0 | channel, _CC_ALL_NOTES_OFF, 0)) for channel in range(16))
+_RTMIDI_NOTE_OFF = tuple(bytes((NOTE_OFF, note, 0)) for note in range(128)) if RTMIDI_AVAILABLE else ()
+
+
+_PCS_VECTOR_MIN = 32
+
+
+def _pcs_to_midi(pitch_classes, octave: int) -> List[int]:
+    """Map pitch classes to MIDI note numbers in the given octave"""
+    octave_base = octave * 12
+    if len(pitch_classes) < _PCS_VECTOR_MIN:
+        return [octave_base + pc for pc in pitch_classes]
+    return (np.asarray(pitch_classes, dtype=np.int16) + octave_base).tolist()
+
+
+def _all_notes_off_fs(fs, sound_off: bool = True):
+    """
+    Silence a FluidSynth synth with channel-mode messages (32 calls, not 2048 noteoffs)
+
+    Args:
+        fs: fluidsynth.Synth
+        sound_off: Also send "All Sound Off", cutting release tails
+    """
+    try:
+        for channel in range(16):
+            if sound_off:
+                fs.cc(channel, _CC_ALL_SOUND_OFF, 0)
+            fs.cc(channel, _CC_ALL_NOTES_OFF, 0)
+    except Exception:
+        pass
+
+
+# Parsed MIDI event kinds, as stored in _MIDI_EVENT_DTYPE's 'kind' field
+_EV_NOTE_OFF, _EV_NOTE_ON, _EV_PROGRAM_CHANGE, _EV_CONTROL_CHANGE, _EV_OTHER = range(5)
+
+# One packed record per event (16 bytes), instead of a tuple of Python objects
+_MIDI_EVENT_DTYPE = np.dtype([
+    ('t', 'f8'),        # Seconds from start
+    ('kind', 'u1'),     # _EV_* code
+    ('channel', 'u1'),
+    ('data1', 'u1'),    # Note, controller or program
+    ('data2', 'u1'),    # Velocity or controller value
+], align=True)
+
+# Parsed MIDI files by content digest, most recently used last
+_MIDI_CACHE = OrderedDict()
+_MIDI_CACHE_MAX = 32
+_MIDI_CACHE_LOCK = threading.Lock()
+
+
+def _parse_midi(midi_bytes: bytes) -> np.ndarray:
+    """
+    Parse MIDI file data into timed events, reusing earlier parses.
+
+    Returns:
+        Read-only structured array of _MIDI_EVENT_DTYPE records for each
+        non-meta message, tracks merged. note_on with velocity 0 becomes
+        note_off. Iterate over .tolist() to get plain
+        (t, kind, channel, data1, data2) tuples.
+    """
+    key = hashlib.blake2b(midi_bytes, digest_size=16).digest()
+    with _MIDI_CACHE_LOCK:
+        events = _MIDI_CACHE.get(key)
+        if events is not None:
+            _MIDI_CACHE.move_to_end(key)
+            return events
+
+    parsed = []
+    t = 0.0
+    for msg in mido.MidiFile(file=io.BytesIO(midi_bytes)):  # Delta times in seconds
+        t += msg.time
+        if msg.is_meta:
+            continue
+        kind = msg.type
+        if kind == 'note_on':
+            parsed.append((t, _EV_NOTE_ON if msg.velocity else _EV_NOTE_OFF,
+                           msg.channel, msg.note, msg.velocity))
+        elif kind == 'note_off':
+            parsed.append((t, _EV_NOTE_OFF, msg.channel, msg.note, msg.velocity))
+        elif kind == 'control_change':
+            parsed.append((t, _EV_CONTROL_CHANGE, msg.channel, msg.control, msg.value))
+        elif kind == 'program_change':
+            parsed.append((t, _EV_PROGRAM_CHANGE, msg.channel, msg.program, 0))
+        else:
+            parsed.append((t, _EV_OTHER, getattr(msg, 'channel', 0), 0, 0))
+    events = np.array(parsed, dtype=_MIDI_EVENT_DTYPE)
+    events.flags.writeable = False  # Shared through the cache
+
+    with _MIDI_CACHE_LOCK:
+        _MIDI_CACHE[key] = events
+        while len(_MIDI_CACHE) > _MIDI_CACHE_MAX:
+            _MIDI_CACHE.popitem(last=False)
+    return events
+
+
+# Default soundfont lookup: candidate paths are built once (bundled first),
+# and the last resolved path is remembered in-process and in QSettings
+_SOUNDFONT_CANDIDATES = (
+    Path(__file__).parent.parent / "resources" / "soundfonts" / "GeneralUser_GS.sf2",
+    Path("/usr/share/soundfonts/FluidR3_GM.sf2"),  # Linux
+    Path("/usr/share/soundfonts/default.sf2"),
+    Path("C:\\soundfonts\\FluidR3_GM.sf2"),  # Windows
+    Path("/System/Library/Components/CoreAudio.component/Contents/Resources/gs_instruments.dls"),  # macOS (DLS)
+)
+_SOUNDFONT_SETTINGS_KEY = "audio/last_soundfont_path"
+_CACHED_DEFAULT_SF: Optional[str] = None
+
+
+def _find_default_soundfont() -> Optional[str]:
+    """Locate a default soundfont, trying the last resolved path first"""
+    global _CACHED_DEFAULT_SF
+    if _CACHED_DEFAULT_SF and os.path.exists(_CACHED_DEFAULT_SF):
+        return _CACHED_DEFAULT_SF
+
+    store = QSettings('SetTheory', 'SetTheoryApp') if PYQT_AVAILABLE else None
+    if store is not None:
+        remembered = store.value(_SOUNDFONT_SETTINGS_KEY, "", type=str)
+        if remembered and os.path.exists(remembered):
+            _CACHED_DEFAULT_SF = remembered
+            return remembered
+
+    path = next((str(p) for p in _SOUNDFONT_CANDIDATES if p.is_file()), None)
+    if path is not None:
+        _CACHED_DEFAULT_SF = path
+        if store is not None:
+            store.setValue(_SOUNDFONT_SETTINGS_KEY, path)
+    return path
+
+
+def _pulse_running() -> bool:
+    """True if a PulseAudio (or pipewire-pulse) server socket is present"""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    return bool(runtime_dir) and os.path.exists(os.path.join(runtime_dir, "pulse", "native"))
+
+
+# FluidSynth audio drivers to try, lowest latency first. SETTHEORY_AUDIO_DRIVER
+# overrides the choice; the driver that last worked is tried before the list
+if sys.platform == 'win32':
+    _PLATFORM_DRIVERS = ('wasapi', 'dsound')
+elif sys.platform == 'darwin':
+    _PLATFORM_DRIVERS = ('coreaudio',)
+elif _pulse_running():
+    _PLATFORM_DRIVERS = ('pulseaudio', 'alsa')
+else:
+    _PLATFORM_DRIVERS = ('alsa',)
+_AUDIO_DRIVER_OVERRIDE = os.environ.get("SETTHEORY_AUDIO_DRIVER")
+_DRIVER_SETTINGS_KEY = "audio/driver"
+
+
+def _audio_driver_candidates() -> List[str]:
+    """Drivers to try in order: override, last successful, platform defaults"""
+    candidates = []
+    if _AUDIO_DRIVER_OVERRIDE:
+        candidates.append(_AUDIO_DRIVER_OVERRIDE)
+    if PYQT_AVAILABLE:
+        remembered = QSettings('SetTheory', 'SetTheoryApp').value(_DRIVER_SETTINGS_KEY, "", type=str)
+        if remembered:
+            candidates.append(remembered)
+    candidates.extend(_PLATFORM_DRIVERS)
+    return list(dict.fromkeys(candidates))
+
+
+def _prewarm_soundfont(path: str):
+    """Fault a soundfont's pages into the page cache so sfload reads from memory"""
+    try:
+        with open(path, 'rb') as f:
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+            # The map is only needed while touching the pages; the page
+            # cache keeps them after it is closed
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_WILLNEED'):
+                    mm.madvise(mmap.MADV_WILLNEED)
+                for offset in range(0, len(mm), mmap.PAGESIZE):
+                    mm[offset]
+    except (OSError, ValueError):
+        pass  # Best effort - sfload reads the file regardless
+
+
+def _start_soundfont_prewarm(path: str) -> threading.Thread:
+    """Start prewarming a soundfont on a daemon thread; join it before sfload"""
+    thread = threading.Thread(target=_prewarm_soundfont, args=(path,), daemon=True)
+    thread.start()
+    return thread
+
+
+def _wait_until(stop: threading.Event, target: float) -> bool:
+    """
+    Wait for time.perf_counter() to reach target unless stop is set.
+
+    Blocks on the event until about 1 ms before the target (so a stop
+    wakes it at once), then spins for the rest. Returns False if stopped.
+    """
+    remaining = target - time.perf_counter()
+    if remaining > 0.002 and stop.wait(remaining - 0.001):
+        return False
+    stopped = stop.is_set
+    while time.perf_counter() < target:
+        if stopped():
+            return False
+    return not stopped()
+
+
+def _dispatch_paced(events, handlers: dict, stop: threading.Event) -> bool:
+    """
+    Deliver parsed MIDI events to handlers at their times, until stopped.
+
+    Events sharing a timestamp (chords, controller groups) are dispatched
+    back to back with a single wait for the group. Returns False if stopped.
+    """
+    handler_for = handlers.get
+    start = time.perf_counter()
+    last_t = None
+    for t, kind, channel, data1, data2 in events:
+        if t != last_t:
+            if not _wait_until(stop, start + t):
+                return False
+            last_t = t
+
+        handler = handler_for(kind)
+        if handler is not None:
+            handler(channel, data1, data2)
+    return True
+
+
 class AudioWorker(QObject if PYQT_AVAILABLE else object):
     """
     FluidSynth worker that runs in a separate thread.
@@ -124,13 +366,23 @@ class AudioWorker(QObject if PYQT_AVAILABLE else object):
         playback_finished = pyqtSignal()
         error_occurred = pyqtSignal(str)
         initialization_complete = pyqtSignal(bool)  # True if successful, False if failed
+        _cancel_requested = pyqtSignal()  # Queued to the worker thread by stop_playback
 
     def __init__(self, settings: AudioSettings):
         if PYQT_AVAILABLE:
             super().__init__()
+            self._cancel_requested.connect(self._cancel_scheduled)
         self.settings = settings
         self.fs = None  # FluidSynth synthesizer
         self.sfid = None  # SoundFont ID
+        self.sequencer = None  # FluidSynth sequencer for timestamped notes
+        self.synth_seq_id = None  # Synth's destination ID on the sequencer
+        self._finish_timer = None  # Emits playback_finished as scheduled notes end
+        self._pending_ends = deque()  # Sequencer end tick of each scheduled request
+        self._busy_until = 0  # Sequencer tick at which scheduled notes run out
+        self._midi_handlers = {}  # Event type -> handler(channel, data1, data2)
+        self._sounding = set()  # (channel, note) held by paced MIDI file playback
+        self._stop = threading.Event()  # Set by stop_playback from any thread
         self.is_initialized = False
         self.is_playing = False
 
@@ -139,57 +391,63 @@ class AudioWorker(QObject if PYQT_AVAILABLE else object):
         """Initialize FluidSynth synthesizer"""
         if not FLUIDSYNTH_AVAILABLE:
             error_msg = "FluidSynth not available. Install with: pip install pyfluidsynth"
-            print(f"Audio Error: {error_msg}")
+            logger.error("Audio Error: %s", error_msg)
             if PYQT_AVAILABLE:
                 self.error_occurred.emit(error_msg)
                 self.initialization_complete.emit(False)
             return False
 
         try:
-            print("Initializing FluidSynth audio engine...")
+            logger.info("Initializing FluidSynth audio engine...")
+
+            # Resolve the soundfont first so its pages are read in while the
+            # synth and audio driver start up
+            soundfont_path = self.settings.soundfont_path
+            if not soundfont_path or not os.path.exists(soundfont_path):
+                # Try to find default soundfont
+                soundfont_path = self._find_default_soundfont()
+                logger.info("  Using default soundfont: %s", soundfont_path)
+            else:
+                logger.info("  Using configured soundfont: %s", soundfont_path)
+            prewarm = None
+            if soundfont_path and os.path.exists(soundfont_path):
+                prewarm = _start_soundfont_prewarm(soundfont_path)
 
             # Create FluidSynth instance
             self.fs = fluidsynth.Synth(
                 samplerate=float(self.settings.sample_rate),
                 gain=0.8  # Master volume (0.0 - 1.0)
             )
-            print(f"  Created synthesizer (sample rate: {self.settings.sample_rate})")
+            logger.info("  Created synthesizer (sample rate: %s)", self.settings.sample_rate)
 
             # Start audio driver
-            driver = 'dsound' if sys.platform == 'win32' else 'coreaudio' if sys.platform == 'darwin' else 'alsa'
-            print(f"  Starting audio driver: {driver}")
-            self.fs.start(driver=driver)
-            print("  Audio driver started successfully")
-
-            # Load soundfont
-            soundfont_path = self.settings.soundfont_path
-            if not soundfont_path or not os.path.exists(soundfont_path):
-                # Try to find default soundfont
-                soundfont_path = self._find_default_soundfont()
-                print(f"  Using default soundfont: {soundfont_path}")
-            else:
-                print(f"  Using configured soundfont: {soundfont_path}")
+            self._start_audio_driver()
 
+            # Load soundfont, once the prewarm has read it in
+            if prewarm is not None:
+                prewarm.join()
             if soundfont_path and os.path.exists(soundfont_path):
-                print(f"  Loading soundfont...")
+                logger.info("  Loading soundfont...")
                 self.sfid = self.fs.sfload(soundfont_path)
                 if self.sfid >= 0:
                     self.fs.program_select(0, self.sfid, 0, 0)  # Channel 0, bank 0, preset 0 (piano)
+                    self._build_midi_handlers()
+                    self._setup_sequencer()
                     self.is_initialized = True
-                    print("  FluidSynth initialization complete!")
+                    logger.info("  FluidSynth initialization complete!")
                     if PYQT_AVAILABLE:
                         self.initialization_complete.emit(True)
                     return True
                 else:
                     error_msg = f"Failed to load soundfont: {soundfont_path}"
-                    print(f"Audio Error: {error_msg}")
+                    logger.error("Audio Error: %s", error_msg)
                     if PYQT_AVAILABLE:
                         self.error_occurred.emit(error_msg)
                         self.initialization_complete.emit(False)
                     return False
             else:
                 error_msg = f"No soundfont found at: {soundfont_path}"
-                print(f"Audio Error: {error_msg}")
+                logger.error("Audio Error: %s", error_msg)
                 if PYQT_AVAILABLE:
                     self.error_occurred.emit(error_msg)
                     self.initialization_complete.emit(False)
@@ -197,37 +455,160 @@ class AudioWorker(QObject if PYQT_AVAILABLE else object):
 
         except Exception as e:
             error_msg = f"Failed to initialize FluidSynth: {str(e)}"
-            print(f"Audio Error: {error_msg}", flush=True)
-            import traceback
-            traceback.print_exc()
-            sys.stdout.flush()
-            sys.stderr.flush()
+            logger.exception("Audio Error: %s", error_msg)
             if PYQT_AVAILABLE:
                 self.error_occurred.emit(error_msg)
                 self.initialization_complete.emit(False)
             return False
 
-    def _find_default_soundfont(self) -> Optional[str]:
-        """Try to find a default soundfont"""
-        # Check bundled soundfont
-        script_dir = Path(__file__).parent.parent
-        bundled_sf = script_dir / "resources" / "soundfonts" / "GeneralUser_GS.sf2"
-        if bundled_sf.exists():
-            return str(bundled_sf)
-
-        # Check common system locations
-        common_paths = [
-            "/usr/share/soundfonts/FluidR3_GM.sf2",  # Linux
-            "/usr/share/soundfonts/default.sf2",
-            "C:\\soundfonts\\FluidR3_GM.sf2",  # Windows
-            "/System/Library/Components/CoreAudio.component/Contents/Resources/gs_instruments.dls",  # macOS (DLS)
-        ]
+    def _start_audio_driver(self):
+        """Start FluidSynth's own audio driver, trying candidates in order"""
+        errors = []
+        for driver in _audio_driver_candidates():
+            logger.info("  Starting audio driver: %s", driver)
+            try:
+                self.fs.start(driver=driver)
+            except Exception as e:
+                errors.append(f"{driver}: {e}")
+                continue
+            # Older pyfluidsynth does not raise when the driver cannot be created
+            if getattr(self.fs, 'audio_driver', True):
+                logger.info("  Audio driver started successfully")
+                if PYQT_AVAILABLE:
+                    QSettings('SetTheory', 'SetTheoryApp').setValue(_DRIVER_SETTINGS_KEY, driver)
+                return
+            errors.append(f"{driver}: could not be created")
+        raise RuntimeError("No audio driver could be started (" + "; ".join(errors) + ")")
+
+    def _build_midi_handlers(self):
+        """Map parsed MIDI event types to synth calls for paced playback"""
+        fs = self.fs
+        noteon, noteoff = fs.noteon, fs.noteoff
+        sounding = self._sounding
+
+        def note_on(channel, note, velocity):
+            sounding.add((channel, note))
+            noteon(channel, note, velocity)
+
+        def note_off(channel, note, _velocity):
+            sounding.discard((channel, note))
+            noteoff(channel, note)
+
+        self._midi_handlers = {
+            _EV_NOTE_ON: note_on,
+            _EV_NOTE_OFF: note_off,
+            # Select instrument for this channel (bank 0)
+            _EV_PROGRAM_CHANGE: lambda channel, program, _: fs.program_select(channel, self.sfid, 0, program),
+            _EV_CONTROL_CHANGE: fs.cc,
+        }
+
+    def _setup_sequencer(self):
+        """
+        Attach a FluidSynth sequencer so notes can be scheduled ahead.
 
-        for path in common_paths:
-            if os.path.exists(path):
-                return path
+        The sequencer runs on the synth's sample clock (no system timer), so
+        scheduled note-on/off events land sample-accurately. Older
+        pyfluidsynth builds without Sequencer keep the sleep-based playback.
+        """
+        if not PYQT_AVAILABLE or not hasattr(fluidsynth, 'Sequencer'):
+            return
+        try:
+            self.sequencer = fluidsynth.Sequencer(time_scale=1000, use_system_timer=False)
+            self.synth_seq_id = self.sequencer.register_fluidsynth(self.fs)
+        except Exception as e:
+            logger.info("  Sequencer unavailable, using timed playback: %s", e)
+            self.sequencer = None
+            self.synth_seq_id = None
 
-        return None
+    def _schedule_notes(self, midi_notes: List[int], arpeggiate: bool):
+        """
+        Schedule a chord or arpeggio on the sequencer and return immediately.
+
+        Timing matches the sleep-based playback: arpeggio notes last
+        `duration` with a 50 ms gap, chords sound together for `duration`.
+        A request arriving mid-playback starts when the previous one ends,
+        as it did when the worker blocked. playback_finished is emitted by
+        a timer as each request ends.
+        """
+        dur_ms = int(self.settings.duration * 1000)
+        step_ms = dur_ms + 50 if arpeggiate else 0
+        velocity = self.settings.velocity
+        schedule_note, dest = self.sequencer.note, self.synth_seq_id
+        now = self.sequencer.get_tick()
+        t0 = max(now, self._busy_until)
+        for i, note in enumerate(midi_notes):
+            schedule_note(t0 + i * step_ms, 0, note, velocity, dur_ms, dest=dest)
+
+        self._finish_at(t0 + (len(midi_notes) * step_ms if arpeggiate else dur_ms), now)
+
+    def _schedule_midi_events(self, events) -> bool:
+        """
+        Schedule parsed MIDI file events on the sequencer.
+
+        The sequencer only carries notes, so program and control changes are
+        applied immediately - this is used only when all of them sit at the
+        start of the file. Returns False if the events cannot be scheduled.
+        """
+        if self.sequencer is None or np.any((events['t'] > 0) & (events['kind'] > _EV_NOTE_ON)):
+            return False
+
+        note_on, note_off = self.sequencer.note_on, self.sequencer.note_off
+        dest = self.synth_seq_id
+        now = self.sequencer.get_tick()
+        t0 = max(now, self._busy_until)
+        end = t0
+        for t, kind, channel, data1, data2 in events.tolist():
+            end = t0 + int(t * 1000)
+            if kind == _EV_NOTE_ON:
+                note_on(end, channel, data1, data2, dest=dest)
+            elif kind == _EV_NOTE_OFF:
+                note_off(end, channel, data1, dest=dest)
+            elif kind == _EV_PROGRAM_CHANGE:
+                self.fs.program_select(channel, self.sfid, 0, data1)
+            elif kind == _EV_CONTROL_CHANGE:
+                self.fs.cc(channel, data1, data2)
+
+        self._finish_at(end, now)
+        return True
+
+    def _finish_at(self, end: int, now: int):
+        """Queue playback_finished for sequencer tick `end`"""
+        self._busy_until = end
+        self._pending_ends.append(end)
+
+        if self._finish_timer is None:
+            # Created here so it lives in the worker thread
+            self._finish_timer = QTimer()
+            self._finish_timer.setSingleShot(True)
+            self._finish_timer.timeout.connect(self._on_scheduled_finished)
+        if not self._finish_timer.isActive():
+            self._finish_timer.start(self._pending_ends[0] - now)
+
+    def _on_scheduled_finished(self):
+        """The oldest scheduled request has ended"""
+        if not self._pending_ends:
+            return
+        self._pending_ends.popleft()
+        if self._pending_ends:
+            self._finish_timer.start(max(0, self._pending_ends[0] - self.sequencer.get_tick()))
+        else:
+            self.is_playing = False
+        self.playback_finished.emit()
+
+    @pyqtSlot() if PYQT_AVAILABLE else lambda x: x
+    def _cancel_scheduled(self):
+        """Drop pending finish notifications after stop_playback (worker thread)"""
+        if not self._pending_ends:
+            return
+        self._finish_timer.stop()
+        self._pending_ends.clear()
+        self._busy_until = 0
+        self.is_playing = False
+        self.playback_finished.emit()
+
+    def _find_default_soundfont(self) -> Optional[str]:
+        """Try to find a default soundfont"""
+        return _find_default_soundfont()
 
     def set_soundfont(self, path: str):
         """Load a different soundfont"""
@@ -261,32 +642,56 @@ class AudioWorker(QObject if PYQT_AVAILABLE else object):
         if not self.is_initialized or not self.fs:
             return
 
+        if self.sequencer is not None:
+            # Timestamped on the synth clock; the worker returns immediately
+            try:
+                if PYQT_AVAILABLE:
+                    self.playback_started.emit()
+                self.is_playing = True
+                midi_notes = _pcs_to_midi(pitch_classes, self.settings.octave)
+                self._schedule_notes(midi_notes, arpeggiate)
+            except Exception as e:
+                if PYQT_AVAILABLE:
+                    self.error_occurred.emit(f"Playback error: {str(e)}")
+                if not self._pending_ends:
+                    self.is_playing = False
+                    if PYQT_AVAILABLE:
+                        self.playback_finished.emit()
+            return
+
         try:
             if PYQT_AVAILABLE:
                 self.playback_started.emit()
             self.is_playing = True
+            self._stop.clear()
 
             # Convert pitch classes to MIDI note numbers
-            midi_notes = [(self.settings.octave * 12) + pc for pc in pitch_classes]
+            midi_notes = _pcs_to_midi(pitch_classes, self.settings.octave)
+
+            # Bound synth calls and settings resolved once for the loops;
+            # waits return early when stop_playback sets the event
+            noteon, noteoff = self.fs.noteon, self.fs.noteoff
+            velocity, duration = self.settings.velocity, self.settings.duration
+            wait, stopped = self._stop.wait, self._stop.is_set
 
             if arpeggiate:
                 # Play notes sequentially
                 for note in midi_notes:
-                    if not self.is_playing:  # Check if playback was stopped
+                    if stopped():  # Check if playback was stopped
                         break
-                    self.fs.noteon(0, note, self.settings.velocity)
-                    time.sleep(self.settings.duration)
-                    self.fs.noteoff(0, note)
-                    time.sleep(0.05)  # Small gap between notes
+                    noteon(0, note, velocity)
+                    wait(duration)
+                    noteoff(0, note)
+                    wait(0.05)  # Small gap between notes
             else:
                 # Play as chord
                 for note in midi_notes:
-                    self.fs.noteon(0, note, self.settings.velocity)
+                    noteon(0, note, velocity)
 
-                time.sleep(self.settings.duration)
+                wait(duration)
 
                 for note in midi_notes:
-                    self.fs.noteoff(0, note)
+                    noteoff(0, note)
 
         except Exception as e:
             if PYQT_AVAILABLE:
@@ -312,57 +717,68 @@ class AudioWorker(QObject if PYQT_AVAILABLE else object):
                 self.error_occurred.emit("mido library not available for MIDI playback")
             return
 
+        scheduled = False
         try:
             if PYQT_AVAILABLE:
                 self.playback_started.emit()
             self.is_playing = True
+            self._stop.clear()
 
-            # Parse MIDI file
-            midi_file = mido.MidiFile(file=io.BytesIO(midi_bytes))
+            # Parse MIDI file (cached by content)
+            events = _parse_midi(midi_bytes)
 
-            # Play all messages
-            for msg in midi_file.play():
-                if not self.is_playing:  # Check if playback was stopped
-                    break
+            # Prefer timestamped delivery; the finish timer then ends playback
+            scheduled = self._schedule_midi_events(events)
+            if scheduled:
+                return
 
-                if msg.type == 'note_on' and msg.velocity > 0:
-                    self.fs.noteon(msg.channel, msg.note, msg.velocity)
-                elif msg.type == 'note_off' or (msg.type == 'note_on' and msg.velocity == 0):
-                    self.fs.noteoff(msg.channel, msg.note)
-                elif msg.type == 'program_change':
-                    # Select instrument for this channel (bank 0)
-                    self.fs.program_select(msg.channel, self.sfid, 0, msg.program)
-                elif msg.type == 'control_change':
-                    self.fs.cc(msg.channel, msg.control, msg.value)
+            # Play all messages at their times
+            _dispatch_paced(events.tolist(), self._midi_handlers, self._stop)
 
         except Exception as e:
             if PYQT_AVAILABLE:
                 self.error_occurred.emit(f"MIDI playback error: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("MIDI playback error")
         finally:
-            # Turn off all notes on all channels
-            if self.fs:
-                for channel in range(16):
-                    for note in range(128):
-                        self.fs.noteoff(channel, note)
-            self.is_playing = False
-            if PYQT_AVAILABLE:
-                self.playback_finished.emit()
+            if not scheduled:
+                # Release whatever the file left held (let it ring out)
+                self._release_sounding()
+                self.is_playing = False
+                if PYQT_AVAILABLE:
+                    self.playback_finished.emit()
 
     def stop_playback(self):
         """Stop current playback immediately"""
+        self._stop.set()
         self.is_playing = False
+        if self.sequencer is not None:
+            # Drop notes that have not sounded yet
+            self.sequencer.remove_events()
+            if PYQT_AVAILABLE:
+                self._cancel_requested.emit()
         if self.fs:
-            # Turn off all notes on all channels (MIDI has 16 channels)
-            for channel in range(16):
-                for note in range(128):
-                    self.fs.noteoff(channel, note)
+            # Silence all channels (MIDI has 16 channels) - this also covers
+            # notes the sequencer started, which are not tracked
+            _all_notes_off_fs(self.fs)
+        self._sounding.clear()
+
+    def _release_sounding(self):
+        """Note-off only the notes paced playback left sounding"""
+        sounding = self._sounding
+        try:
+            noteoff = self.fs.noteoff
+            while sounding:
+                noteoff(*sounding.pop())
+        except Exception:
+            sounding.clear()
 
     def cleanup(self):
         """Clean up FluidSynth resources"""
         if self.fs:
             self.stop_playback()
+            if self.sequencer is not None:
+                self.sequencer.delete()
+                self.sequencer = None
             if self.sfid is not None:
                 self.fs.sfunload(self.sfid)
             self.fs.delete()
@@ -387,6 +803,9 @@ class RTMidiWorker(QObject if PYQT_AVAILABLE else object):
             super().__init__()
         self.settings = settings
         self.midi_out = None
+        self._midi_handlers = {}  # Event type -> handler(channel, data1, data2)
+        self._sounding = set()  # Notes we have sent note-on for and not yet released
+        self._stop = threading.Event()  # Set by stop_playback from any thread
         self.is_initialized = False
         self.is_playing = False
 
@@ -395,47 +814,59 @@ class RTMidiWorker(QObject if PYQT_AVAILABLE else object):
         """Initialize python-rtmidi MIDI output"""
         if not RTMIDI_AVAILABLE:
             error_msg = "python-rtmidi not available. Install with: pip install python-rtmidi"
-            print(f"Audio Error: {error_msg}")
+            logger.error("Audio Error: %s", error_msg)
             if PYQT_AVAILABLE:
                 self.error_occurred.emit(error_msg)
                 self.initialization_complete.emit(False)
             return False
 
         try:
-            print("Initializing python-rtmidi audio engine...")
+            logger.info("Initializing python-rtmidi audio engine...")
 
             # Create MIDI output
             self.midi_out = rtmidi.MidiOut()
 
             # Get available ports
             available_ports = self.midi_out.get_ports()
-            print(f"  Available MIDI ports: {available_ports}")
+            logger.info("  Available MIDI ports: %s", available_ports)
 
             # Try to open a port
             if available_ports:
                 # Use first available port
                 self.midi_out.open_port(0)
-                print(f"  Opened MIDI port: {available_ports[0]}")
+                logger.info("  Opened MIDI port: %s", available_ports[0])
             else:
                 # Create virtual port
                 self.midi_out.open_virtual_port("SetTheory Audio")
-                print("  Created virtual MIDI port: SetTheory Audio")
+                logger.info("  Created virtual MIDI port: SetTheory Audio")
 
             # Set program to Acoustic Grand Piano (program 0)
             program_change = [0xC0, 0]  # Program Change on channel 0
             self.midi_out.send_message(program_change)
 
+            send = self.midi_out.send_message
+            sounding = self._sounding
+
+            def note_on(_channel, note, velocity):
+                sounding.add(note)
+                send([NOTE_ON, note, velocity])
+
+            def note_off(_channel, note, _velocity):
+                sounding.discard(note)
+                send(_RTMIDI_NOTE_OFF[note])
+
+            # Other MIDI messages are not forwarded
+            self._midi_handlers = {_EV_NOTE_ON: note_on, _EV_NOTE_OFF: note_off}
+
             self.is_initialized = True
-            print("  python-rtmidi initialization complete!")
+            logger.info("  python-rtmidi initialization complete!")
             if PYQT_AVAILABLE:
                 self.initialization_complete.emit(True)
             return True
 
         except Exception as e:
             error_msg = f"Failed to initialize python-rtmidi: {str(e)}"
-            print(f"Audio Error: {error_msg}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Audio Error: %s", error_msg)
             if PYQT_AVAILABLE:
                 self.error_occurred.emit(error_msg)
                 self.initialization_complete.emit(False)
@@ -457,34 +888,39 @@ class RTMidiWorker(QObject if PYQT_AVAILABLE else object):
             if PYQT_AVAILABLE:
                 self.playback_started.emit()
             self.is_playing = True
+            self._stop.clear()
 
-            # Convert pitch classes to MIDI note numbers
-            midi_notes = [(self.settings.octave * 12) + pc for pc in pitch_classes]
+            # Convert pitch classes to MIDI note numbers, then to messages
+            midi_notes = _pcs_to_midi(pitch_classes, self.settings.octave)
+            velocity, duration = self.settings.velocity, self.settings.duration
+            on_msgs = [bytes((NOTE_ON, note, velocity)) for note in midi_notes]
+            off_msgs = [_RTMIDI_NOTE_OFF[note] for note in midi_notes]
+            send = self.midi_out.send_message
+            sounding = self._sounding
+            wait, stopped = self._stop.wait, self._stop.is_set
 
             if arpeggiate:
                 # Play notes sequentially
-                for note in midi_notes:
-                    if not self.is_playing:
+                for note, note_on, note_off in zip(midi_notes, on_msgs, off_msgs):
+                    if stopped():
                         break
-                    # Note On
-                    note_on = [NOTE_ON, note, self.settings.velocity]
-                    self.midi_out.send_message(note_on)
-                    time.sleep(self.settings.duration)
-                    # Note Off
-                    note_off = [NOTE_OFF, note, 0]
-                    self.midi_out.send_message(note_off)
-                    time.sleep(0.05)  # Small gap between notes
+                    sounding.add(note)
+                    send(note_on)
+                    wait(duration)
+                    sounding.discard(note)
+                    send(note_off)
+                    wait(0.05)  # Small gap between notes
             else:
                 # Play as chord
-                for note in midi_notes:
-                    note_on = [NOTE_ON, note, self.settings.velocity]
-                    self.midi_out.send_message(note_on)
+                sounding.update(midi_notes)
+                for note_on in on_msgs:
+                    send(note_on)
 
-                time.sleep(self.settings.duration)
+                wait(duration)
 
-                for note in midi_notes:
-                    note_off = [NOTE_OFF, note, 0]
-                    self.midi_out.send_message(note_off)
+                sounding.difference_update(midi_notes)
+                for note_off in off_msgs:
+                    send(note_off)
 
         except Exception as e:
             if PYQT_AVAILABLE:
@@ -514,51 +950,55 @@ class RTMidiWorker(QObject if PYQT_AVAILABLE else object):
             if PYQT_AVAILABLE:
                 self.playback_started.emit()
             self.is_playing = True
+            self._stop.clear()
 
-            # Parse MIDI file
-            midi_file = mido.MidiFile(file=io.BytesIO(midi_bytes))
-
-            # Play all messages
-            for msg in midi_file.play():
-                if not self.is_playing:  # Check if playback was stopped
-                    break
+            # Parse MIDI file (cached by content)
+            events = _parse_midi(midi_bytes)
 
-                if msg.type == 'note_on' and msg.velocity > 0:
-                    note_on = [NOTE_ON, msg.note, msg.velocity]
-                    self.midi_out.send_message(note_on)
-                elif msg.type == 'note_off' or (msg.type == 'note_on' and msg.velocity == 0):
-                    note_off = [NOTE_OFF, msg.note, 0]
-                    self.midi_out.send_message(note_off)
-                # Handle other MIDI messages if needed
+            # Play all messages at their times
+            _dispatch_paced(events.tolist(), self._midi_handlers, self._stop)
 
         except Exception as e:
             if PYQT_AVAILABLE:
                 self.error_occurred.emit(f"MIDI playback error: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("MIDI playback error")
         finally:
-            # Turn off all notes
-            if self.midi_out:
-                for note in range(128):
-                    note_off = [NOTE_OFF, note, 0]
-                    self.midi_out.send_message(note_off)
+            # Release whatever the file left held
+            self._release_sounding()
             self.is_playing = False
             if PYQT_AVAILABLE:
                 self.playback_finished.emit()
 
     def stop_playback(self):
         """Stop current playback immediately"""
+        self._stop.set()
         self.is_playing = False
-        if self.midi_out:
-            # Send All Notes Off message
-            for note in range(128):
-                note_off = [NOTE_OFF, note, 0]
-                self.midi_out.send_message(note_off)
+        self._release_sounding()
+
+    def _release_sounding(self):
+        """Note-off only the notes still sounding - usually none or a few"""
+        sounding = self._sounding
+        try:
+            send = self.midi_out.send_message
+            while sounding:
+                send(_RTMIDI_NOTE_OFF[sounding.pop()])
+        except Exception:
+            sounding.clear()
+
+    def _send_all_notes_off(self):
+        """Send "All Notes Off" on every channel"""
+        try:
+            for message in _RTMIDI_ALL_NOTES_OFF:
+                self.midi_out.send_message(message)
+        except Exception:
+            pass
 
     def cleanup(self):
         """Clean up python-rtmidi resources"""
         if self.midi_out:
             self.stop_playback()
+            # Safety net for anything not tracked before closing the port
+            self._send_all_notes_off()
             self.midi_out.close_port()
             del self.midi_out
             self.midi_out = None
@@ -577,8 +1017,9 @@ class FluidSynthEngine(QObject if PYQT_AVAILABLE else object):
         error_occurred = pyqtSignal(str)
         play_request = pyqtSignal(list, bool)  # Signal to request playback
         play_midi_request = pyqtSignal(bytes)  # Signal to request MIDI file playback
+        _init_request = pyqtSignal()  # Queued to the current worker's initialize()
 
-    def __init__(self, settings: Optional[AudioSettings] = None):
+    def __init__(self, settings: Optional[AudioSettings] = None, defer_start: bool = False):
         if PYQT_AVAILABLE:
             super().__init__()
 
@@ -590,61 +1031,123 @@ class FluidSynthEngine(QObject if PYQT_AVAILABLE else object):
         self.is_initialized = False
 
         if self.is_available:
-            self._setup_worker()
+            self._setup_worker(start=not defer_start)
 
-    def _setup_worker(self):
+    def _setup_worker(self, start: bool = True):
         """Setup worker thread for audio playback"""
         if not PYQT_AVAILABLE:
             return
 
         # Try FluidSynth first, then fall back to RTMidi
         if FLUIDSYNTH_AVAILABLE:
-            print("Attempting to use FluidSynth audio engine...")
+            logger.info("Attempting to use FluidSynth audio engine...")
             self.engine_type = 'fluidsynth'
             self.worker = AudioWorker(self.settings)
         elif RTMIDI_AVAILABLE:
-            print("FluidSynth not available, using python-rtmidi fallback...")
+            logger.info("FluidSynth not available, using python-rtmidi fallback...")
             self.engine_type = 'rtmidi'
             self.worker = RTMidiWorker(self.settings)
         else:
-            print("No audio engine available!")
+            logger.warning("No audio engine available!")
             return
 
-        # Create thread
+        # One worker thread for the engine's lifetime; whichever worker is
+        # installed on it initializes as soon as the thread runs
         self.thread = QThread()
+        self.thread.started.connect(self._init_request)
+        self._install_worker(self.worker)
+
+        if start:
+            self.start()
+
+    def _install_worker(self, worker):
+        """Move a worker onto the engine thread and route signals to it"""
+        self.worker = worker
+        worker.moveToThread(self.thread)
+        self._connect_worker_signals(worker)
+        if self.thread.isRunning():
+            self._init_request.emit()
+
+    def _connect_worker_signals(self, worker):
+        """Connect worker signals to the engine and engine requests to the worker"""
+        worker.playback_started.connect(self.playback_started)
+        worker.playback_finished.connect(self.playback_finished)
+        worker.error_occurred.connect(self.error_occurred)
+        worker.initialization_complete.connect(self._on_initialization_complete)
+
+        self.play_request.connect(worker.play_pitch_classes)
+        self.play_midi_request.connect(worker.play_midi_data)
+        self._init_request.connect(worker.initialize)
+
+    def _disconnect_worker_signals(self, worker):
+        """Undo _connect_worker_signals so a replaced worker gets no requests"""
+        connections = [
+            (worker.playback_started, self.playback_started),
+            (worker.playback_finished, self.playback_finished),
+            (worker.error_occurred, self.error_occurred),
+            (worker.initialization_complete, self._on_initialization_complete),
+            (self.play_request, worker.play_pitch_classes),
+            (self.play_midi_request, worker.play_midi_data),
+            (self._init_request, worker.initialize),
+        ]
+        for signal, slot in connections:
+            try:
+                signal.disconnect(slot)
+            except TypeError:
+                pass  # Not connected
+
+    def start(self):
+        """
+        Start the worker thread, which loads the synth/SoundFont in the background.
 
-        # Move worker to thread
-        self.worker.moveToThread(self.thread)
+        Only needed when constructed with defer_start=True; completion is
+        reported through the worker's initialization_complete signal.
+        """
+        if self.thread is not None and not self.thread.isRunning():
+            self.thread.start()
 
-        # Connect signals
-        self.worker.playback_started.connect(self.playback_started)
-        self.worker.playback_finished.connect(self.playback_finished)
-        self.worker.error_occurred.connect(self.error_occurred)
-        self.worker.initialization_complete.connect(self._on_initialization_complete)
+    def wait_for_ready(self, timeout_ms: int = 3000) -> bool:
+        """
+        Block until the worker has finished initializing, or timeout_ms passes.
 
-        # Connect play request signals to worker methods
-        self.play_request.connect(self.worker.play_pitch_classes)
-        self.play_midi_request.connect(self.worker.play_midi_data)
+        Runs a local event loop so the queued initialization_complete is
+        delivered. Only for scripts and tests - the GUI reacts to the signal.
 
-        # Start thread and initialize
-        self.thread.started.connect(self.worker.initialize)
-        self.thread.start()
+        Returns:
+            True if the engine is initialized
+        """
+        if self.is_initialized or self.worker is None:
+            return self.is_initialized
 
-        # Wait a bit for initialization
-        time.sleep(1.0)
+        loop = QEventLoop()
+        worker = self.worker
+        worker.initialization_complete.connect(loop.quit)
+        try:
+            # A completion emitted before the connect is already queued
+            QCoreApplication.processEvents()
+            if not self.is_initialized:
+                QTimer.singleShot(timeout_ms, loop.quit)
+                loop.exec()
+                QCoreApplication.processEvents()
+        finally:
+            try:
+                worker.initialization_complete.disconnect(loop.quit)
+            except RuntimeError:
+                pass  # Worker was replaced by the fallback and deleted
+        return self.is_initialized
 
     def _on_initialization_complete(self, success: bool):
         """Handle initialization completion"""
-        print(f"[DEBUG] _on_initialization_complete called: success={success}, engine_type={self.engine_type}", flush=True)
+        logger.debug("_on_initialization_complete called: success=%s, engine_type=%s", success, self.engine_type)
         self.is_initialized = success
         if success:
             engine_name = "FluidSynth" if self.engine_type == 'fluidsynth' else "python-rtmidi"
-            print(f"Audio engine ready! Using: {engine_name}", flush=True)
+            logger.info("Audio engine ready! Using: %s", engine_name)
         else:
-            print(f"Audio engine initialization failed ({self.engine_type})", flush=True)
+            logger.warning("Audio engine initialization failed (%s)", self.engine_type)
             # If FluidSynth failed, try RTMidi as fallback
             if self.engine_type == 'fluidsynth' and RTMIDI_AVAILABLE:
-                print("Attempting fallback to python-rtmidi...", flush=True)
+                logger.info("Attempting fallback to python-rtmidi...")
                 self._try_rtmidi_fallback()
 
     def _try_rtmidi_fallback(self):
@@ -652,35 +1155,17 @@ class FluidSynthEngine(QObject if PYQT_AVAILABLE else object):
         if not RTMIDI_AVAILABLE:
             return
 
-        # Clean up failed FluidSynth worker
-        if self.worker:
-            self.worker.cleanup()
-        if self.thread:
-            self.thread.quit()
-            self.thread.wait()
+        # Retire the failed FluidSynth worker; the thread keeps running
+        old = self.worker
+        if old:
+            self._disconnect_worker_signals(old)
+            old.cleanup()
+            old.deleteLater()
 
-        # Setup RTMidi worker
-        print("Setting up python-rtmidi fallback...")
+        logger.info("Setting up python-rtmidi fallback...")
         self.engine_type = 'rtmidi'
-        self.worker = RTMidiWorker(self.settings)
-        self.thread = QThread()
-
-        # Move worker to thread
-        self.worker.moveToThread(self.thread)
-
-        # Connect signals
-        self.worker.playback_started.connect(self.playback_started)
-        self.worker.playback_finished.connect(self.playback_finished)
-        self.worker.error_occurred.connect(self.error_occurred)
-        self.worker.initialization_complete.connect(self._on_initialization_complete)
-
-        # Connect play request signals
-        self.play_request.connect(self.worker.play_pitch_classes)
-        self.play_midi_request.connect(self.worker.play_midi_data)
-
-        # Start thread and initialize
-        self.thread.started.connect(self.worker.initialize)
-        self.thread.start()
+        self._install_worker(RTMidiWorker(self.settings))
+        self.start()
 
     def play_pitch_classes(self, pitch_classes: List[int], arpeggiate: bool = False):
         """
@@ -750,6 +1235,7 @@ def test_audio_engine():
     from PyQt6.QtWidgets import QApplication
 
     app = QApplication(sys.argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
 
     print("Testing FluidSynth Audio Engine...")
     print(f"FluidSynth available: {FLUIDSYNTH_AVAILABLE}")
@@ -768,7 +1254,7 @@ def test_audio_engine():
     engine.playback_finished.connect(lambda: print("Playback finished"))
 
     # Wait for initialization
-    time.sleep(1)
+    engine.wait_for_ready()
 
     if not engine.is_available:
         print("Audio engine not available")
@@ -6,6 +6,7 @@ Bottom dock showing live analysis results
 from PyQt6.QtWidgets import (QDockWidget, QWidget, QVBoxLayout, QFormLayout,
                               QLabel, QPushButton, QTextEdit)
 from PyQt6.QtCore import pyqtSignal, pyqtSlot, Qt
+from functools import lru_cache
 from pathlib import Path
 import sys
 
@@ -15,6 +16,29 @@ from pitch_class_set import PitchClassSet
 from forte_classification import ForteClassification
 
 
+# Text of every interval-vector component (an interval class occurs at most 12 times)
+_IV_DIGITS = tuple(str(n) for n in range(13))
+
+
+@lru_cache(maxsize=4096)
+def _z_and_symmetry(mask: int) -> tuple:
+    """
+    Z-partner and I0-symmetry of a set, keyed by its 12-bit mask.
+
+    Returns:
+        Tuple of (Z-partner Forte number or None, whether I0 maps the set to itself)
+    """
+    pcs = PitchClassSet([pc for pc in range(12) if mask >> pc & 1])
+    z_partner = ForteClassification.get_z_partner(pcs)
+
+    # I0 sends pitch class pc to -pc, i.e. bit pc to bit (12 - pc) % 12
+    inverted = 0
+    for pc in range(12):
+        if mask >> pc & 1:
+            inverted |= 1 << (-pc % 12)
+    return z_partner, inverted == mask
+
+
 class AnalysisPanel(QDockWidget):
     """
     Dockable panel showing analysis results.
@@ -30,6 +54,7 @@ class AnalysisPanel(QDockWidget):
 
         self.forte_classification = ForteClassification()
         self.current_set = None
+        self._shown_key = None  # Sorted pitch classes the labels currently show
 
         self._setup_ui()
 
@@ -114,6 +139,13 @@ class AnalysisPanel(QDockWidget):
 
         self.current_set = pcs
 
+        # Everything shown depends only on the set's contents, so the same
+        # set arriving again (re-emitted on edits, playback order changes)
+        # leaves the labels and info text as they are
+        key = pcs.sorted_pitch_classes()
+        if key == self._shown_key:
+            return
+
         try:
             # Prime form (returns a list, not a PitchClassSet)
             prime = pcs.prime_form()
@@ -125,7 +157,8 @@ class AnalysisPanel(QDockWidget):
 
             # Interval vector
             iv = pcs.interval_vector()
-            iv_str = ''.join(map(str, iv))
+            d = _IV_DIGITS
+            iv_str = f"{d[iv[0]]}{d[iv[1]]}{d[iv[2]]}{d[iv[3]]}{d[iv[4]]}{d[iv[5]]}"
             self.interval_vector_label.setText(f"<{iv_str}>")
 
             # Cardinality
@@ -133,13 +166,14 @@ class AnalysisPanel(QDockWidget):
 
             # Complement
             complement = pcs.complement()
-            self.complement_label.setText(str(sorted(complement.pitch_classes)))
+            self.complement_label.setText(complement.display_str())
 
             # Enable full analysis button
             self.full_analysis_button.setEnabled(True)
 
             # Update info text
             self._update_info_text(pcs)
+            self._shown_key = key
 
         except Exception as e:
             print(f"Error updating analysis: {e}")
@@ -155,25 +189,24 @@ class AnalysisPanel(QDockWidget):
         self.full_analysis_button.setEnabled(False)
         self.info_text.clear()
         self.current_set = None
+        self._shown_key = None
 
     def _update_info_text(self, pcs: PitchClassSet):
         """Update additional info text"""
         info_lines = []
 
-        # Z-relation check
         try:
-            z_partner = self.forte_classification.get_z_partner(pcs)
-            if z_partner:
-                info_lines.append(f"Z-related to: {z_partner}")
+            z_partner, symmetric = _z_and_symmetry(pcs.bitmask())
         except Exception:
-            pass
+            z_partner, symmetric = None, False
+
+        # Z-relation check
+        if z_partner:
+            info_lines.append(f"Z-related to: {z_partner}")
 
         # Symmetry
-        try:
-            if pcs == pcs.inversion(0):
-                info_lines.append("Symmetrical (inversionally)")
-        except Exception:
-            pass
+        if symmetric:
+            info_lines.append("Symmetrical (inversionally)")
 
         if info_lines:
             self.info_text.setText('\n'.join(info_lines))
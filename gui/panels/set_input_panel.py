@@ -40,6 +40,7 @@ class SetInputPanel(QWidget):
         super().__init__(parent)
 
         self.current_set = None
+        self._recent_items = {}  # Set text -> its item in recent_list
         self._setup_ui()
         self._connect_signals()
 
@@ -217,6 +218,17 @@ class SetInputPanel(QWidget):
 
         self.transformationRequested.emit(trans_type, value)
 
+    def apply_transformation(self, trans_type: str):
+        """
+        Apply a transformation as if its button were clicked
+
+        Args:
+            trans_type: 'T', 'I' or 'R' (ignored while the button is disabled)
+        """
+        button = {'T': self.t_button, 'I': self.i_button, 'R': self.r_button}.get(trans_type)
+        if button is not None and button.isEnabled():
+            self._apply_transformation(trans_type)
+
     def _on_play_clicked(self):
         """Handle play button click"""
         arpeggiate = self.play_mode.currentText() == "Arpeggio"
@@ -224,11 +236,10 @@ class SetInputPanel(QWidget):
 
     def _on_recent_clicked(self, item: QListWidgetItem):
         """Handle recent set clicked"""
-        text = item.text()
-        # Extract pitch classes from text (format: "[0, 1, 3, 6]")
-        if '[' in text:
-            pcs_text = text[text.index('['):text.index(']')+1]
-            self.input_field.setText(pcs_text)
+        # The item carries its set; no need to parse the text back
+        pcs = item.data(Qt.ItemDataRole.UserRole)
+        if pcs:
+            self.input_field.set_pitch_class_set(pcs, emit=True)
 
     def get_current_set(self):
         """Get the current pitch class set"""
@@ -241,21 +252,23 @@ class SetInputPanel(QWidget):
     def add_to_recent(self, pcs: PitchClassSet):
         """Add a set to recent list"""
         # Format: [0, 1, 3, 6]
-        text = str(sorted(pcs.pitch_classes))
+        text = pcs.display_str()
 
-        # Check if already in list
-        for i in range(self.recent_list.count()):
-            if text in self.recent_list.item(i).text():
-                # Remove it (we'll add to top)
-                self.recent_list.takeItem(i)
-                break
+        # Already in list: remove it (we'll add to top)
+        item = self._recent_items.pop(text, None)
+        if item is not None:
+            self.recent_list.takeItem(self.recent_list.row(item))
 
         # Add to top
-        self.recent_list.insertItem(0, text)
+        item = QListWidgetItem(text)
+        item.setData(Qt.ItemDataRole.UserRole, pcs)
+        self.recent_list.insertItem(0, item)
+        self._recent_items[text] = item
 
         # Keep only last 10
         while self.recent_list.count() > 10:
-            self.recent_list.takeItem(self.recent_list.count() - 1)
+            oldest = self.recent_list.takeItem(self.recent_list.count() - 1)
+            del self._recent_items[oldest.text()]
 
 
 # Test panel
@@ -3,19 +3,183 @@ Subset Explorer Panel
 Browse subsets and supersets of a pitch class set
 """
 
-from PyQt6.QtWidgets import (QDockWidget, QWidget, QVBoxLayout, QTreeWidget,
-                              QTreeWidgetItem, QLabel, QPushButton, QSpinBox,
+from PyQt6.QtWidgets import (QDockWidget, QWidget, QVBoxLayout, QTreeView,
+                              QLabel, QPushButton, QSpinBox,
                               QHBoxLayout, QGroupBox)
-from PyQt6.QtCore import pyqtSignal, pyqtSlot, Qt
+from PyQt6.QtCore import (pyqtSignal, pyqtSlot, Qt, QThreadPool,
+                          QAbstractItemModel, QModelIndex)
+from functools import lru_cache
 from pathlib import Path
 import sys
 
+import numpy as np
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-from pitch_class_set import PitchClassSet
+from pitch_class_set import PitchClassSet, interval_vector_from_mask
 from forte_classification import ForteClassification
 
 
+# Text of every interval-vector component (an interval class occurs at most 12 times)
+_IV_DIGITS = tuple(str(n) for n in range(13))
+
+
+def _mask_to_pcs(mask: int) -> list:
+    """Sorted pitch classes of a 12-bit set mask"""
+    return [pc for pc in range(12) if mask >> pc & 1]
+
+
+def _lex_ordered_masks() -> tuple:
+    """
+    All 4096 set masks in lexicographic order of their sorted pitch classes
+    (the order itertools.combinations gives), with their cardinalities.
+
+    Among sets of one size that order is falling order of the bit-reversed
+    mask: the first pitch class where two sets differ is in the earlier
+    set only, and after reversal it is the highest bit either holds.
+    """
+    masks = np.arange(4096, dtype=np.uint16)
+    bits = (masks[:, None] >> np.arange(12, dtype=np.uint16)) & 1
+    reversed_masks = (bits << np.arange(11, -1, -1, dtype=np.uint16)).sum(axis=1)
+    order = np.argsort(-reversed_masks.astype(np.int32), kind='stable')
+    return masks[order], bits.sum(axis=1, dtype=np.uint8)[order]
+
+
+# Filtering this pre-ordered array keeps combination order without sorting
+_LEX_MASKS, _LEX_CARDINALITIES = _lex_ordered_masks()
+
+
+def _subset_masks(mask: int, size: int) -> np.ndarray:
+    """
+    All size-element subsets of a 12-bit set mask, in the order
+    itertools.combinations gives for the sorted pitch classes.
+    """
+    if size < 1:
+        return _LEX_MASKS[:0]
+    keep = ((_LEX_MASKS & ~np.uint16(mask)) == 0) & (_LEX_CARDINALITIES == size)
+    return _LEX_MASKS[keep]
+
+
+def _superset_masks(mask: int) -> np.ndarray:
+    """Supersets with one more pitch class, by rising added pitch class"""
+    keep = ((_LEX_MASKS & np.uint16(mask)) == mask) & (_LEX_CARDINALITIES == bin(mask).count('1') + 1)
+    return _LEX_MASKS[keep]
+
+
+def _mask_interval_vector(mask: int) -> str:
+    """Interval vector of a 12-bit set mask as '<ic1..ic6>' text"""
+    d = _IV_DIGITS
+    iv = interval_vector_from_mask(mask)
+    return f"<{d[iv[0]]}{d[iv[1]]}{d[iv[2]]}{d[iv[3]]}{d[iv[4]]}{d[iv[5]]}>"
+
+
+@lru_cache(maxsize=1)
+def _mask_tables() -> tuple:
+    """
+    Display columns for every one of the 4096 possible sets, indexed by mask.
+
+    Built on first use (one batch classification); afterwards populating a
+    row is three tuple lookups.
+
+    Returns:
+        Tuple of (set text, Forte number or "-", interval vector text) tuples
+    """
+    masks = range(4096)
+    forte_numbers = ForteClassification.classify_masks(masks)
+    return (tuple(str(_mask_to_pcs(mask)) for mask in masks),
+            tuple(forte_num or "-" for forte_num in forte_numbers),
+            tuple(_mask_interval_vector(mask) for mask in masks))
+
+
+class _Group:
+    """A header row of the subset model and the set masks under it"""
+
+    __slots__ = ('row', 'title', 'masks')
+
+    def __init__(self, row: int, title: str, masks: np.ndarray):
+        self.row = row
+        self.title = title
+        self.masks = masks
+
+
+class SubsetModel(QAbstractItemModel):
+    """
+    Two-level model of subset/superset groups.
+
+    Each group keeps its sets as a uint16 mask array; cell text is looked
+    up from the shared mask tables only when the view asks for it.
+    """
+
+    HEADERS = ("Set", "Forte Number", "Interval Vector")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._groups = []
+
+    def set_groups(self, groups: list):
+        """Replace the contents with (title, mask array) pairs"""
+        self.beginResetModel()
+        self._groups = [_Group(row, title, masks)
+                        for row, (title, masks) in enumerate(groups)]
+        self.endResetModel()
+
+    def clear(self):
+        """Remove all groups"""
+        self.set_groups([])
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            # Header rows carry no pointer
+            return self.createIndex(row, column)
+        # Set rows point at their group
+        return self.createIndex(row, column, self._groups[parent.row()])
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        group = index.internalPointer()
+        if group is None:
+            return QModelIndex()
+        return self.createIndex(group.row, 0)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self._groups)
+        if parent.column() > 0 or parent.internalPointer() is not None:
+            return 0
+        return len(self._groups[parent.row()].masks)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        group = index.internalPointer()
+        if group is None:
+            if role == Qt.ItemDataRole.DisplayRole:
+                header = self._groups[index.row()]
+                if index.column() == 0:
+                    return header.title
+                if index.column() == 1:
+                    return f"({len(header.masks)} sets)"
+            return None
+
+        mask = int(group.masks[index.row()])
+        if role == Qt.ItemDataRole.DisplayRole:
+            return _mask_tables()[index.column()][mask]
+        if role == Qt.ItemDataRole.UserRole:
+            return mask
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+
 class SubsetExplorer(QDockWidget):
     """
     Dockable panel for exploring subsets and supersets.
@@ -29,6 +193,10 @@ class SubsetExplorer(QDockWidget):
         self.forte_classification = ForteClassification()
         self.current_set = None
 
+        # Build the row tables on a pool thread so the first set shown
+        # does not pay for them on the GUI thread
+        QThreadPool.globalInstance().start(_mask_tables)
+
         self._setup_ui()
 
     def _setup_ui(self):
@@ -58,12 +226,14 @@ class SubsetExplorer(QDockWidget):
         layout.addLayout(controls_layout)
 
         # Tree widget
-        self.tree = QTreeWidget()
-        self.tree.setHeaderLabels(["Set", "Forte Number", "Interval Vector"])
+        self.model = SubsetModel(self)
+        self.tree = QTreeView()
+        self.tree.setModel(self.model)
+        self.tree.setUniformRowHeights(True)
         self.tree.setColumnWidth(0, 150)
         self.tree.setColumnWidth(1, 80)
-        self.tree.itemClicked.connect(self._on_item_clicked)
-        self.tree.itemDoubleClicked.connect(self._on_item_double_clicked)
+        self.tree.clicked.connect(self._on_item_clicked)
+        self.tree.doubleClicked.connect(self._on_item_double_clicked)
         layout.addWidget(self.tree)
 
         # Info label
@@ -98,9 +268,9 @@ class SubsetExplorer(QDockWidget):
     def update_set(self, pcs: PitchClassSet):
         """Update explorer with new set"""
         self.current_set = pcs
-        self.tree.clear()
 
         if pcs is None:
+            self.model.clear()
             self.find_subsets_button.setEnabled(False)
             self.info_label.setText("Enter a pitch class set to explore subsets")
             return
@@ -108,7 +278,7 @@ class SubsetExplorer(QDockWidget):
         self.find_subsets_button.setEnabled(True)
 
         cardinality = len(pcs.pitch_classes)
-        self.info_label.setText(f"Current set: {sorted(pcs.pitch_classes)} "
+        self.info_label.setText(f"Current set: {pcs.display_str()} "
                                f"(Cardinality: {cardinality})")
 
         # Set subset size range
@@ -116,95 +286,69 @@ class SubsetExplorer(QDockWidget):
         if cardinality > 1:
             self.subset_size_spin.setValue(cardinality - 1)
 
-        # Auto-display subsets of size n-1
+        # Auto-display subsets of size n-1; the rebuild replaces the old
+        # groups in the same model reset, so only clear when there is none
         if cardinality > 1:
             self._find_subsets()
+        else:
+            self.model.clear()
 
     def _find_subsets(self):
         """Find and display subsets"""
         if not self.current_set:
             return
 
-        self.tree.clear()
-
         subset_size = self.subset_size_spin.value()
         cardinality = len(self.current_set.pitch_classes)
 
-        # Find subsets
-        if subset_size < cardinality:
-            subsets = self.current_set.find_subsets(subset_size)
-
-            # Create subsets group
-            subset_parent = QTreeWidgetItem(self.tree)
-            subset_parent.setText(0, f"Subsets (size {subset_size})")
-            subset_parent.setText(1, f"({len(subsets)} sets)")
-            subset_parent.setExpanded(True)
-
-            for subset in subsets:
-                item = QTreeWidgetItem(subset_parent)
-                item.setText(0, str(sorted(subset.pitch_classes)))
-
-                # Forte number
-                forte_num = self.forte_classification.get_forte_number(subset)
-                item.setText(1, forte_num or "-")
+        mask = self.current_set.bitmask()
 
-                # Interval vector
-                iv = subset.interval_vector()
-                iv_str = ''.join(map(str, iv))
-                item.setText(2, f"<{iv_str}>")
+        groups = []
 
-                # Store set in item data
-                item.setData(0, Qt.ItemDataRole.UserRole, subset)
+        # Find subsets
+        if subset_size < cardinality:
+            groups.append((f"Subsets (size {subset_size})",
+                           _subset_masks(mask, subset_size)))
 
         # Find supersets
         superset_size = cardinality + 1
         if superset_size <= 12:
-            supersets = self.current_set.find_supersets(superset_size)
-
-            # Create supersets group
-            superset_parent = QTreeWidgetItem(self.tree)
-            superset_parent.setText(0, f"Supersets (size {superset_size})")
-            superset_parent.setText(1, f"({len(supersets)} sets)")
-            superset_parent.setExpanded(False)
+            groups.append((f"Supersets (size {superset_size})",
+                           _superset_masks(mask)))
 
-            for superset in supersets:
-                item = QTreeWidgetItem(superset_parent)
-                item.setText(0, str(sorted(superset.pitch_classes)))
+        self.model.set_groups(groups)
 
-                # Forte number
-                forte_num = self.forte_classification.get_forte_number(superset)
-                item.setText(1, forte_num or "-")
-
-                # Interval vector
-                iv = superset.interval_vector()
-                iv_str = ''.join(map(str, iv))
-                item.setText(2, f"<{iv_str}>")
+        # Subsets open, supersets collapsed; the view only asks the model
+        # for rows it actually shows
+        if subset_size < cardinality:
+            self.tree.expand(self.model.index(0, 0))
 
-                # Store set in item data
-                item.setData(0, Qt.ItemDataRole.UserRole, superset)
+        self.info_label.setText(f"Found {self.model.rowCount()} groups")
 
-        self.info_label.setText(f"Found {self.tree.topLevelItemCount()} groups")
+    def _item_set(self, index) -> PitchClassSet:
+        """The set shown on a row, or None for a group header"""
+        mask = index.data(Qt.ItemDataRole.UserRole)
+        return PitchClassSet(_mask_to_pcs(mask)) if mask else None
 
-    def _on_item_clicked(self, item, column):
+    def _on_item_clicked(self, index):
         """Handle item clicked"""
-        # Check if it's a child item (not a group header)
-        pcs = item.data(0, Qt.ItemDataRole.UserRole)
-        if pcs:
+        # Check if it's a set row (not a group header)
+        if index.data(Qt.ItemDataRole.UserRole):
             self.use_button.setEnabled(True)
         else:
             self.use_button.setEnabled(False)
 
-    def _on_item_double_clicked(self, item, column):
+    def _on_item_double_clicked(self, index):
         """Handle item double-clicked - use the set"""
-        pcs = item.data(0, Qt.ItemDataRole.UserRole)
+        pcs = self._item_set(index)
         if pcs:
             self.setSelected.emit(pcs)
 
     def _use_selected(self):
         """Use the selected set"""
-        current_item = self.tree.currentItem()
-        if current_item:
-            pcs = current_item.data(0, Qt.ItemDataRole.UserRole)
+        current_index = self.tree.currentIndex()
+        if current_index.isValid():
+            pcs = self._item_set(current_index)
             if pcs:
                 self.setSelected.emit(pcs)
 
@@ -228,7 +372,7 @@ if __name__ == "__main__":
 
     # Connect signals
     panel.setSelected.connect(
-        lambda pcs: print(f"Set selected: {sorted(pcs.pitch_classes)}")
+        lambda pcs: print(f"Set selected: {pcs.display_str()}")
     )
 
     window.resize(800, 600)
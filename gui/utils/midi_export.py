@@ -8,6 +8,8 @@ from typing import List, Optional
 from pathlib import Path
 import sys
 
+import numpy as np
+
 # Add parent directories to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from pitch_class_set import PitchClassSet
@@ -39,6 +41,18 @@ class MIDIExporter:
         self.bpm = bpm
         self.duration = duration
 
+    def _midi_table(self, pcs: PitchClassSet, sign: int) -> List[List[int]]:
+        """
+        MIDI notes of all 12 transpositions (sign=1) or inversions (sign=-1)
+
+        Row i holds the ascending notes of T(i)/I(i); as sets the retrogrades
+        RT(i)/RI(i) are the same rows, and notes are written in ascending order.
+        """
+        base = np.fromiter(pcs.pitch_classes, dtype=np.int16)
+        table = (np.arange(12, dtype=np.int16)[:, None] + sign * base[None, :]) % 12
+        table.sort(axis=1)
+        return (table + self.octave * 12).tolist()
+
     def export_set_to_midi(self, pcs: PitchClassSet, filename: str,
                            arpeggiate: bool = True) -> bool:
         """
@@ -62,7 +76,8 @@ class MIDIExporter:
             s.append(instrument.Piano())
 
             # Convert pitch classes to MIDI note numbers
-            midi_notes = [(self.octave * 12) + pc for pc in sorted(pcs.pitch_classes)]
+            midi_base = self.octave * 12
+            midi_notes = [midi_base + pc for pc in pcs.sorted_pitch_classes()]
 
             if arpeggiate:
                 # Sequential notes
@@ -105,17 +120,13 @@ class MIDIExporter:
             score.append(tempo.MetronomeMark(number=self.bpm))
 
             # Create a part for each transposition
-            for i in range(12):
+            for i, midi_notes in enumerate(self._midi_table(pcs, 1)):
                 part = stream.Part()
                 part.partName = f"T{i}"
 
                 # Set instrument (piano)
                 part.append(instrument.Piano())
 
-                # Get transposed set
-                transposed = pcs.transposition(i)
-                midi_notes = [(self.octave * 12) + pc for pc in sorted(transposed.pitch_classes)]
-
                 if arpeggiate:
                     for midi_num in midi_notes:
                         n = note.Note(midi_num)
@@ -154,14 +165,11 @@ class MIDIExporter:
             score = stream.Score()
             score.append(tempo.MetronomeMark(number=self.bpm))
 
-            for i in range(12):
+            for i, midi_notes in enumerate(self._midi_table(pcs, -1)):
                 part = stream.Part()
                 part.partName = f"I{i}"
                 part.append(instrument.Piano())
 
-                inverted = pcs.inversion(i)
-                midi_notes = [(self.octave * 12) + pc for pc in sorted(inverted.pitch_classes)]
-
                 if arpeggiate:
                     for midi_num in midi_notes:
                         n = note.Note(midi_num)
@@ -199,14 +207,11 @@ class MIDIExporter:
             score = stream.Score()
             score.append(tempo.MetronomeMark(number=self.bpm))
 
-            for i in range(12):
+            for i, midi_notes in enumerate(self._midi_table(pcs, 1)):
                 part = stream.Part()
                 part.partName = f"RT{i}"
                 part.append(instrument.Piano())
 
-                retrograded = pcs.retrograde().transposition(i)
-                midi_notes = [(self.octave * 12) + pc for pc in sorted(retrograded.pitch_classes)]
-
                 if arpeggiate:
                     for midi_num in midi_notes:
                         n = note.Note(midi_num)
@@ -244,14 +249,11 @@ class MIDIExporter:
             score = stream.Score()
             score.append(tempo.MetronomeMark(number=self.bpm))
 
-            for i in range(12):
+            for i, midi_notes in enumerate(self._midi_table(pcs, -1)):
                 part = stream.Part()
                 part.partName = f"RI{i}"
                 part.append(instrument.Piano())
 
-                ri = pcs.retrograde_inversion(i)
-                midi_notes = [(self.octave * 12) + pc for pc in sorted(ri.pitch_classes)]
-
                 if arpeggiate:
                     for midi_num in midi_notes:
                         n = note.Note(midi_num)
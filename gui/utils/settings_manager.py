@@ -56,6 +56,7 @@ class SettingsManager:
             # Recent data
             'history/recent_sets': [],  # List of recent pitch class sets
             'history/recent_forte': [],  # List of recent Forte numbers
+            'history/last_export_dir': '',  # Folder of the last MIDI export
         }
 
     def get(self, key: str, default=None):
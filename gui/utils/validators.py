@@ -13,6 +13,15 @@ try:
 except ImportError:
     PYQT_AVAILABLE = False
 
+# Patterns used on every keystroke, compiled once
+_FORTE_RE = re.compile(r'^\d+-\d+[AB]?$')
+_BRACKETS_RE = re.compile(r'[\[\]{}()]')
+_SEPARATORS_RE = re.compile(r'[,\s]+')
+_DIGITS_RE = re.compile(r'^\d+$')
+_DIGITS_DASH_RE = re.compile(r'^\d+-$')
+_PARTIAL_RE = re.compile(r'^[\d,\s\[\]{}()-]*$')
+_INVALID_CHARS_RE = re.compile(r'[^0-9,\s\[\]{}()-]')
+
 
 def parse_pitch_classes(text: str) -> Optional[List[int]]:
     """
@@ -36,7 +45,7 @@ def parse_pitch_classes(text: str) -> Optional[List[int]]:
         return None
 
     # Check if it's a Forte number (e.g., "3-11")
-    if re.match(r'^\d+-\d+[AB]?$', text):
+    if _FORTE_RE.match(text):
         try:
             from pathlib import Path
             import sys
@@ -52,10 +61,10 @@ def parse_pitch_classes(text: str) -> Optional[List[int]]:
             return None
 
     # Remove brackets if present
-    text = re.sub(r'[\[\]{}()]', '', text)
+    text = _BRACKETS_RE.sub('', text)
 
     # Split by comma, space, or both
-    parts = re.split(r'[,\s]+', text)
+    parts = _SEPARATORS_RE.split(text)
 
     # Parse integers
     pitch_classes = []
@@ -138,11 +147,11 @@ if PYQT_AVAILABLE:
                 return (QValidator.State.Intermediate, input_str, pos)
 
             # Check if it's a Forte number in progress
-            if re.match(r'^\d+$', input_str.strip()):
+            if _DIGITS_RE.match(input_str.strip()):
                 # Just a number - might be typing Forte number
                 return (QValidator.State.Intermediate, input_str, pos)
 
-            if re.match(r'^\d+-$', input_str.strip()):
+            if _DIGITS_DASH_RE.match(input_str.strip()):
                 # Number followed by dash - definitely typing Forte number
                 return (QValidator.State.Intermediate, input_str, pos)
 
@@ -155,7 +164,7 @@ if PYQT_AVAILABLE:
 
             # Check if input is partially valid (intermediate)
             # Allow digits, spaces, commas, brackets while typing
-            if re.match(r'^[\d,\s\[\]{}()-]*$', input_str):
+            if _PARTIAL_RE.match(input_str):
                 # Contains only valid characters - might be incomplete
                 return (QValidator.State.Intermediate, input_str, pos)
 
@@ -173,7 +182,7 @@ if PYQT_AVAILABLE:
                 Fixed string
             """
             # Remove invalid characters
-            fixed = re.sub(r'[^0-9,\s\[\]{}()-]', '', input_str)
+            fixed = _INVALID_CHARS_RE.sub('', input_str)
 
             # Try to parse and reformat
             pcs = parse_pitch_classes(fixed)
@@ -163,21 +163,28 @@ class PitchClassInput(QLineEdit):
                 return None
         return None
 
-    def set_pitch_class_set(self, pcs: PitchClassSet):
+    def set_pitch_class_set(self, pcs: PitchClassSet, emit: bool = False):
         """
         Set the input to a pitch class set
 
         Args:
             pcs: PitchClassSet to display
+            emit: Emit setChanged now with pcs instead of re-parsing the
+                text after the debounce delay
         """
         if pcs is None:
             self.clear()
             return
 
         # Format as space-separated
-        text = ' '.join(map(str, sorted(pcs.pitch_classes)))
+        text = ' '.join(map(str, pcs.sorted_pitch_classes()))
         self.setText(text)
 
+        if emit:
+            self.debouncer.cancel()
+            self.current_set = pcs
+            self.setChanged.emit(pcs)
+
     def set_forte_number(self, forte_number: str):
         """
         Set input to a Forte number
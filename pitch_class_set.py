@@ -12,6 +12,27 @@ from itertools import combinations, permutations
 import math
 
 
+def interval_vector_from_mask(mask: int) -> List[int]:
+    """
+    Calculate the interval vector of a set given as a 12-bit mask.
+    
+    Pairs a distance ic apart are the overlap of the mask with itself
+    rotated by ic; tritone pairs are seen from both ends.
+    
+    Args:
+        mask: Set encoded as a 12-bit mask (bit n set for pitch class n)
+    
+    Returns:
+        List of 6 integers representing interval class counts
+    """
+    interval_counts = []
+    for ic in range(1, 7):
+        rotated = ((mask << ic) | (mask >> (12 - ic))) & 0xFFF
+        interval_counts.append(bin(mask & rotated).count('1'))
+    interval_counts[5] //= 2
+    return interval_counts
+
+
 @dataclass
 class PitchClassSet:
     """
@@ -20,6 +41,9 @@ class PitchClassSet:
     Pitch classes are represented as integers 0-11:
     0=C, 1=C#, 2=D, 3=D#, 4=E, 5=F, 6=F#, 7=G, 8=G#, 9=A, 10=A#, 11=B
     """
+    __slots__ = ('pitch_classes', 'cardinality', '_hash_cache', '_prime_form_cache', '_iv_cache',
+                 '_sorted_cache', '_display_cache')
+    
     pitch_classes: List[int]
     
     def __post_init__(self):
@@ -27,6 +51,16 @@ class PitchClassSet:
         self.pitch_classes = sorted(list(set([pc % 12 for pc in self.pitch_classes])))
         self.cardinality = len(self.pitch_classes)
     
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name == 'pitch_classes':
+            # Cached derived values belong to the old pitch classes
+            object.__setattr__(self, '_hash_cache', None)
+            object.__setattr__(self, '_prime_form_cache', None)
+            object.__setattr__(self, '_iv_cache', None)
+            object.__setattr__(self, '_sorted_cache', None)
+            object.__setattr__(self, '_display_cache', None)
+    
     def __str__(self):
         return f"PCS({self.pitch_classes})"
     
@@ -39,7 +73,9 @@ class PitchClassSet:
         return self.pitch_classes == other.pitch_classes
     
     def __hash__(self):
-        return hash(tuple(self.pitch_classes))
+        if self._hash_cache is None:
+            object.__setattr__(self, '_hash_cache', hash(tuple(self.pitch_classes)))
+        return self._hash_cache
     
     def __len__(self):
         return self.cardinality
@@ -135,6 +171,28 @@ class PitchClassSet:
         inverted = self.inversion(n)
         return inverted.retrograde()
     
+    def sorted_pitch_classes(self) -> Tuple[int, ...]:
+        """
+        Get the pitch classes in ascending order, regardless of playback order.
+        
+        Returns:
+            Tuple of sorted pitch classes (computed once per set)
+        """
+        if self._sorted_cache is None:
+            object.__setattr__(self, '_sorted_cache', tuple(sorted(self.pitch_classes)))
+        return self._sorted_cache
+    
+    def display_str(self) -> str:
+        """
+        Get the sorted pitch classes as display text, e.g. "[0, 1, 3, 6]".
+        
+        Returns:
+            String of the sorted pitch class list (computed once per set)
+        """
+        if self._display_cache is None:
+            object.__setattr__(self, '_display_cache', str(list(self.sorted_pitch_classes())))
+        return self._display_cache
+    
     def get_playback_order(self) -> List[int]:
         """
         Get pitch classes in playback order (for sequential playback).
@@ -155,6 +213,9 @@ class PitchClassSet:
         if not self.pitch_classes:
             return []
         
+        if self._prime_form_cache is not None:
+            return list(self._prime_form_cache)
+        
         # Try all rotations and inversions to find the lexicographically smallest
         candidates = []
         
@@ -170,7 +231,43 @@ class PitchClassSet:
             candidates.append(rotated_inv.pitch_classes)
         
         # Find the lexicographically smallest
-        return min(candidates)
+        prime = min(candidates)
+        object.__setattr__(self, '_prime_form_cache', tuple(prime))
+        return prime
+    
+    def bitmask(self) -> int:
+        """
+        Encode the set as a 12-bit mask (bit n set for pitch class n).
+        
+        Returns:
+            Integer bitmask of the set
+        """
+        mask = 0
+        for pc in self.pitch_classes:
+            mask |= 1 << pc
+        return mask
+    
+    def prime_form_mask(self) -> int:
+        """
+        Find the prime form encoded as a 12-bit mask (bit n set for pitch class n).
+        
+        Gives the same set as prime_form() without building the candidate lists.
+        
+        Returns:
+            Integer bitmask of the prime form
+        """
+        mask = 0
+        inverted_mask = 0
+        for pc in self.pitch_classes:
+            mask |= 1 << pc
+            inverted_mask |= 1 << ((-pc) % 12)
+        
+        # Of two sorted candidates, the lexicographically smaller one is
+        # the one holding the lowest pitch class they disagree on
+        diff = mask ^ inverted_mask
+        if diff and not mask & (diff & -diff):
+            return inverted_mask
+        return mask
     
     def interval_vector(self) -> List[int]:
         """
@@ -182,15 +279,11 @@ class PitchClassSet:
         if len(self.pitch_classes) < 2:
             return [0, 0, 0, 0, 0, 0]
         
-        interval_counts = [0] * 6
-        
-        # Calculate all intervals between pairs
-        for i in range(len(self.pitch_classes)):
-            for j in range(i + 1, len(self.pitch_classes)):
-                interval = abs(self.pitch_classes[i] - self.pitch_classes[j])
-                interval_class = min(interval, 12 - interval)
-                interval_counts[interval_class - 1] += 1
+        if self._iv_cache is not None:
+            return list(self._iv_cache)
         
+        interval_counts = interval_vector_from_mask(self.bitmask())
+        object.__setattr__(self, '_iv_cache', tuple(interval_counts))
         return interval_counts
     
     def is_subset_of(self, other: 'PitchClassSet') -> bool:
@@ -292,32 +385,13 @@ class PitchClassSet:
     def forte_number(self) -> Optional[str]:
         """
         Find the Forte number for this set (if it exists).
-        This is a simplified implementation - a complete Forte table would be needed.
         
         Returns:
             Forte number as string (e.g., "3-1") or None if not found
         """
-        # This is a placeholder - a complete implementation would require
-        # the full Forte classification table
-        prime = self.prime_form()
-        
-        # Some well-known Forte numbers for demonstration
-        forte_map = {
-            (0, 1, 2): "3-1",      # Trichord 1
-            (0, 1, 3): "3-2",      # Trichord 2
-            (0, 1, 4): "3-3",      # Trichord 3
-            (0, 1, 5): "3-4",      # Trichord 4
-            (0, 1, 6): "3-5",      # Trichord 5
-            (0, 2, 4): "3-6",      # Trichord 6
-            (0, 2, 5): "3-7",      # Trichord 7
-            (0, 2, 6): "3-8",      # Trichord 8
-            (0, 2, 7): "3-9",      # Trichord 9
-            (0, 3, 6): "3-10",     # Trichord 10
-            (0, 3, 7): "3-11",     # Trichord 11
-            (0, 4, 8): "3-12",     # Trichord 12
-        }
-        
-        return forte_map.get(tuple(prime))
+        # Imported lazily: forte_classification imports this module
+        from forte_classification import ForteClassification
+        return ForteClassification.get_forte_number(self)
 
 
 def generate_all_sets(cardinality: int) -> List[PitchClassSet]:
@@ -62,16 +62,18 @@ class SetAnalyzer:
         # Find subsets
         for size in range(1, len(pcs)):
             subsets = pcs.find_subsets(size)
-            analysis['subsets'][size] = [(subset.pitch_classes, 
-                                        self.forte_classification.get_forte_number(subset)) 
-                                       for subset in subsets]
+            forte_numbers = self.forte_classification.classify_masks(
+                [subset.bitmask() for subset in subsets])
+            analysis['subsets'][size] = list(zip([subset.pitch_classes for subset in subsets],
+                                                 forte_numbers))
         
         # Find supersets
         for size in range(len(pcs) + 1, 13):
             supersets = pcs.find_supersets(size)
-            analysis['supersets'][size] = [(superset.pitch_classes,
-                                          self.forte_classification.get_forte_number(superset))
-                                         for superset in supersets]
+            forte_numbers = self.forte_classification.classify_masks(
+                [superset.bitmask() for superset in supersets])
+            analysis['supersets'][size] = list(zip([superset.pitch_classes for superset in supersets],
+                                                   forte_numbers))
         
         # Find similar sets
         if analysis['forte_number']:
@@ -208,16 +210,8 @@ class SetGenerator:
         Returns:
             List of pitch class sets with the given interval vector
         """
-        matching_sets = []
-        
-        # Check all cardinalities
-        for cardinality in range(1, 13):
-            sets_with_cardinality = self.forte_classification.get_all_sets_by_cardinality(cardinality)
-            for pcs, forte_num in sets_with_cardinality:
-                if pcs.interval_vector() == target_iv:
-                    matching_sets.append(pcs)
-        
-        return matching_sets
+        matches = self.forte_classification.find_sets_by_interval_vector(target_iv)
+        return [pcs for pcs, forte_num in matches]
     
     def generate_sets_by_forte_number(self, forte_number: str) -> List[PitchClassSet]:
         """